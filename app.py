@@ -1,8 +1,13 @@
 import calendar
+import concurrent.futures
 import datetime as dt
-from dash import Dash, html, dcc, callback, Output, Input, State, ALL, ctx, clientside_callback
+import functools
+from types import SimpleNamespace
+from typing import Dict, FrozenSet, List, Tuple
+from dash import Dash, html, dcc, callback, Output, Input, State, ClientsideFunction, clientside_callback, no_update
 import dash_bootstrap_components as dbc
-from moon import FeastDays, enumerate_sabbaths, enumerate_new_moons, get_moon_phase, get_lunar_year_starts
+import moon
+from moon import NOON, MOON_PHASES, phase_bucket, FeastDays, enumerate_sabbaths, new_moons_from_separations, get_moon_phase, get_moon_phases, get_lunar_year_starts, NewMoonTable
 from scriptures import SCRIPTURE_TEXT
 
 # Initialize the app with Bootstrap styling
@@ -14,10 +19,6 @@ server = app.server  # For deployment
 # Pre-compute lunar data for 2024-2028
 # ---------------------------------------------------------------------------
 
-def _normalise_date(d):
-    return d.date() if isinstance(d, dt.datetime) else d
-
-
 MOON_EMOJI = {
     "New Moon":        "\U0001F311",   # 🌑
     "Waxing Crescent": "\U0001F312",   # 🌒
@@ -28,246 +29,449 @@ MOON_EMOJI = {
     "Third Quarter":   "\U0001F317",   # 🌗
     "Waning Crescent": "\U0001F318",   # 🌘
 }
+# Same emoji indexed by moon.phase_bucket(), for the per-cell lookups
+MOON_EMOJI_TUPLE = tuple(MOON_EMOJI[phase] for phase in MOON_PHASES)
 
 FEAST_EMOJI = "\U0001F389"   # 🎉
 SABBATH_EMOJI = "\U0001F54A\uFE0F"  # 🕊️
 NEW_YEAR_EMOJI = "\U0001F387"  # 🎇
 
 
-def _build_data():
-    """Compute new moons, sabbaths and feast days for multiple lunar years."""
-    raw_moons = enumerate_new_moons(dt.datetime(2024, 1, 1), dt.datetime(2028, 1, 1))
-    new_moon_dates = {_normalise_date(k): v for k, v in raw_moons.items()}
+DATA_START = dt.date(2024, 1, 1)
+DATA_END = dt.date(2028, 1, 1)
+
+_MONTH_LEN = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _days_in_month(year, month):
+    """calendar.monthrange(year, month)[1] without computing the weekday as well."""
+    return _MONTH_LEN[month - 1] + (month == 2 and calendar.isleap(year))
+
+
+def _build_data() -> Tuple[Dict[dt.date, float], FrozenSet[dt.date], Dict[dt.date, moon.FeastDay],
+                             FrozenSet[dt.date], Dict[int, Tuple[str, float]]]:
+    """Compute new moons, sabbaths, feast days and daily moon phases for multiple lunar years."""
+    # Moon phase at noon for every day in range, evaluated in a single ephemeris call;
+    # the new moons are read off the same separations (see enumerate_new_moons_vectorized)
+    days = [DATA_START + dt.timedelta(days=n) for n in range((DATA_END - DATA_START).days + 1)]
+    phases = get_moon_phases([dt.datetime.combine(d, NOON) for d in days])
+    day_phases = {d.toordinal(): p for d, p in zip(days, phases)}
+
+    raw_moons = new_moons_from_separations([dt.datetime.combine(d, dt.time()) for d in days],
+                                           [angle for _, angle in phases])
+    # moon.py returns naive datetimes throughout; the app keys everything by date
+    new_moon_dates = {k.date(): v for k, v in raw_moons.items()}
 
     sabbath_list = enumerate_sabbaths(list(raw_moons.keys()))
-    sabbath_dates = {_normalise_date(d) for d in sabbath_list}
+    sabbath_dates = frozenset(d.date() for d in sabbath_list)
+
+    # One sorted table serves both the year-start and the feast lookups
+    moon_table = NewMoonTable.from_new_moons(raw_moons)
+    year_starts = get_lunar_year_starts(moon_table, 2024, 2027)
+
+    raw_feasts = FeastDays.find_feast_days_batch(list(year_starts.values()), moon_table)
+    feast_dates = {k.date(): v for k, v in raw_feasts.items()}
+
+    new_year_dates = frozenset(d.date() for d in year_starts.values())
+
+    return new_moon_dates, sabbath_dates, feast_dates, new_year_dates, day_phases
+
+
+# Bump whenever the shape of _build_data()'s result changes. Changes to moon.py
+# invalidate the cache automatically since its source is part of the key.
+CACHE_VERSION = 3
+
+
+def _cache_path():
+    return moon.disk_cache_path("lunar", DATA_START, DATA_END, CACHE_VERSION)
+
+
+def _load_data():
+    """Return _build_data(), reusing the result pickled by a previous start if present."""
+    return moon.load_or_build_pickle(_cache_path(), _build_data)
+
+
+NEW_YEAR_FLAG, FEAST_FLAG, SABBATH_FLAG, NEW_MOON_FLAG = 1, 2, 4, 8
+# Badge emoji per flag, in display order
+_BADGE_TABLE = ((NEW_YEAR_FLAG, NEW_YEAR_EMOJI), (FEAST_FLAG, FEAST_EMOJI), (SABBATH_FLAG, SABBATH_EMOJI))
+_BADGE_MASK = NEW_YEAR_FLAG | FEAST_FLAG | SABBATH_FLAG
+# Joined badge string for each combination of badge flags, indexed by flags & _BADGE_MASK
+_BADGE_STRINGS = tuple(" ".join(emoji for bit, emoji in _BADGE_TABLE if i & bit) for i in range(_BADGE_MASK + 1))
+
+
+def _build_day_flags(new_moon_dates, sabbath_dates, feast_dates, new_year_dates):
+    """Pack each annotated day's kinds into one flag byte, indexed by ordinal - base."""
+    kinds = ((new_year_dates, NEW_YEAR_FLAG), (feast_dates, FEAST_FLAG),
+             (sabbath_dates, SABBATH_FLAG), (new_moon_dates, NEW_MOON_FLAG))
+    ordinals = [d.toordinal() for dates, _ in kinds for d in dates]
+    base = min(ordinals, default=0)
+    flags = bytearray(max(ordinals, default=-1) - base + 1)
+    for dates, flag in kinds:
+        for d in dates:
+            flags[d.toordinal() - base] |= flag
+    return base, bytes(flags)
+
 
-    year_starts = get_lunar_year_starts(raw_moons, 2024, 2027)
-    new_moon_list = list(raw_moons.keys())
+def _build_day_index(flags_base, day_flags):
+    """Map the ordinal of every annotated date to its pre-rendered badge string and new moon flag."""
+    index = {}
+    for i, flags in enumerate(day_flags):
+        if not flags:
+            continue
+        index[flags_base + i] = {"badge_str": _BADGE_STRINGS[flags & _BADGE_MASK],
+                                 "new_moon": bool(flags & NEW_MOON_FLAG)}
+    return index
 
-    feast_dates = {}
-    for y, start in year_starts.items():
-        raw = FeastDays.find_feast_days(start, new_moon_list)
-        for k, v in raw.items():
-            feast_dates[_normalise_date(k)] = v
 
-    new_year_dates = {_normalise_date(d) for d in year_starts.values()}
+def _phase_line(phase, angle):
+    return f"{MOON_EMOJI.get(phase, '')} {phase} (angle: {angle:.1f}°)"
 
-    return new_moon_dates, sabbath_dates, feast_dates, new_year_dates
 
+def _build_day_meta(day_phases, day_index):
+    """Pre-render (cell moon emoji, badge string, phase line) for every day with a known phase."""
+    meta = {}
+    for ordinal, (phase, angle) in day_phases.items():
+        entry = day_index.get(ordinal)
+        moon_em = MOON_EMOJI_TUPLE[0 if entry and entry["new_moon"] else phase_bucket(angle)]
+        meta[ordinal] = (moon_em, entry["badge_str"] if entry else "", _phase_line(phase, angle))
+    return meta
 
-NEW_MOON_DATES, SABBATH_DATES, FEAST_DATES, NEW_YEAR_DATES = _build_data()
+
+def _load_tables():
+    new_moon_dates, sabbath_dates, feast_dates, new_year_dates, day_phases = _load_data()
+    flags_base, day_flags = _build_day_flags(new_moon_dates, sabbath_dates, feast_dates, new_year_dates)
+    day_index = _build_day_index(flags_base, day_flags)
+    return SimpleNamespace(
+        NEW_MOON_DATES=new_moon_dates,
+        SABBATH_DATES=sabbath_dates,
+        FEAST_DATES=feast_dates,
+        NEW_YEAR_DATES=new_year_dates,
+        DAY_PHASES=day_phases,
+        DAY_FLAGS_BASE=flags_base,
+        DAY_FLAGS=day_flags,
+        DAY_INDEX=day_index,
+        DAY_META=_build_day_meta(day_phases, day_index),
+        # Every day of a feast shows the same panel, so build one per feast and share it;
+        # this is also the only place the scripture texts are looked up
+        FEAST_PANELS={fd.value.name: _feast_panel(fd.value) for fd in FeastDays},
+    )
+
+
+def _tables():
+    return _TABLES_FUTURE.result()
+
+
+def __getattr__(name):
+    # Module-level access such as app.FEAST_DATES resolves against the loaded tables
+    if not name.startswith("_") and name.isupper():
+        tables = _tables()
+        if hasattr(tables, name):
+            return getattr(tables, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ---------------------------------------------------------------------------
 # Helper functions
 # ---------------------------------------------------------------------------
 
-def get_moon_emoji(day_date):
+@functools.lru_cache(maxsize=4096)
+def _noon_phase(ordinal):
+    """Return the (phase, angle) of the moon at noon on the day with the given ordinal."""
+    day_phases = _tables().DAY_PHASES
+    if ordinal in day_phases:
+        return day_phases[ordinal]
+    return get_moon_phase(dt.datetime.combine(dt.date.fromordinal(ordinal), NOON))
+
+
+def _day_flags(ordinal):
+    tables = _tables()
+    i = ordinal - tables.DAY_FLAGS_BASE
+    return tables.DAY_FLAGS[i] if 0 <= i < len(tables.DAY_FLAGS) else 0
+
+
+def _moon_emoji(ordinal):
+    meta = _tables().DAY_INDEX.get(ordinal)
+    if meta and meta["new_moon"]:
+        return MOON_EMOJI_TUPLE[0]
+    _, angle = _noon_phase(ordinal)
+    return MOON_EMOJI_TUPLE[phase_bucket(angle)]
+
+
+def get_moon_emoji(day_date: dt.date) -> str:
     """Return moon phase emoji for a given date."""
-    if day_date in NEW_MOON_DATES:
-        return MOON_EMOJI["New Moon"]
-    phase, _ = get_moon_phase(dt.datetime.combine(day_date, dt.time(12, 0)))
-    return MOON_EMOJI.get(phase, "")
+    return _moon_emoji(day_date.toordinal())
 
 
-def get_day_badges(day_date):
+def get_day_badges(day_date: dt.date) -> List[str]:
     """Return list of emoji badges for a calendar day."""
-    badges = []
-    if day_date in NEW_YEAR_DATES:
-        badges.append(NEW_YEAR_EMOJI)
-    if day_date in FEAST_DATES:
-        badges.append(FEAST_EMOJI)
-    if day_date in SABBATH_DATES:
-        badges.append(SABBATH_EMOJI)
-    return badges
+    flags = _day_flags(day_date.toordinal())
+    return [emoji for bit, emoji in _BADGE_TABLE if flags & bit]
+
+
+@functools.lru_cache(maxsize=4096)
+def _day_cell_content(ordinal):
+    """Return the (moon emoji, badge string) shown in the cell of the day with the given ordinal."""
+    tables = _tables()
+    meta = tables.DAY_META.get(ordinal)
+    if meta:
+        return meta[0], meta[1]
+    entry = tables.DAY_INDEX.get(ordinal)
+    return _moon_emoji(ordinal), entry["badge_str"] if entry else ""
+
+
+def _cell_payload(base_ordinal, day):
+    if day == 0:
+        return None
+    moon_em, badge_str = _day_cell_content(base_ordinal + day)
+    return {"day": day, "moon": moon_em, "badges": badge_str}
+
+
+_CAL = calendar.Calendar(firstweekday=0)
+
+
+@functools.lru_cache(maxsize=128)
+def month_payload(year, month):
+    """Return the compact cell data for a month: weeks of {day, moon, badges} dicts, None for padding."""
+    base = dt.date(year, month, 1).toordinal() - 1
+    cells = (_cell_payload(base, day) for day in _CAL.itermonthdays(year, month))
+    return tuple(zip(*[cells] * 7))
+
+
+@functools.lru_cache(maxsize=1)
+def day_meta_payload():
+    """Return DAY_META's cell content keyed by ISO date, for rendering grids in the browser."""
+    return {dt.date.fromordinal(o).isoformat(): [moon_em, badge_str]
+            for o, (moon_em, badge_str, _) in _tables().DAY_META.items()}
+
+
+# Padding cells are identical in every month, so all grids share one instance
+_EMPTY_CELL = html.Td("", className="empty-cell")
 
 
-def create_calendar_grid(year, month, selected_day):
+def _day_cell(cell, selected):
+    """Build the html.Td for one payload cell, highlighted when selected."""
+    if cell is None:
+        return _EMPTY_CELL
+    cell_children = [
+        str(cell["day"]),
+        html.Div(cell["moon"], className="day-moon"),
+    ]
+    if cell["badges"]:
+        cell_children.append(html.Div(cell["badges"], className="day-badges"))
+
+    return html.Td(cell_children, className="day-cell selected" if selected else "day-cell", **{"data-day": cell["day"]})
+
+
+@functools.lru_cache(maxsize=128)
+def _month_template(year, month):
+    """Return the month's rows of unhighlighted cells; only the selected cell is rebuilt per render."""
+    return tuple(
+        tuple(_day_cell(cell, False) for cell in week)
+        for week in month_payload(year, month)
+    )
+
+
+MONTH_NAMES = {
+    (y, m): dt.date(y, m, 1).strftime("%B %Y")
+    for y in range(DATA_START.year - 1, DATA_END.year + 1) for m in range(1, 13)
+}
+
+
+def month_name(year: int, month: int) -> str:
+    """Return the "January 2024" style title for a month."""
+    return MONTH_NAMES.get((year, month)) or dt.date(year, month, 1).strftime("%B %Y")
+
+
+_HEADER_ROW = html.Tr([
+    html.Th(d, className="weekday-header")
+    for d in ["Mo", "Tu", "We", "Th", "Fr", "Sa", "Su"]
+])
+
+
+@functools.lru_cache(maxsize=512)
+def create_calendar_grid(year: int, month: int, selected_day: int) -> html.Table:
     """Generate the calendar grid for a given month."""
-    cal = calendar.monthcalendar(year, month)
-    weekdays = ["Mo", "Tu", "We", "Th", "Fr", "Sa", "Su"]
-
-    header = html.Tr([
-        html.Th(d, style={"textAlign": "center", "padding": "8px 4px", "fontWeight": "bold", "fontSize": "0.85rem"})
-        for d in weekdays
-    ])
-
-    rows = [header]
-    for week in cal:
-        cells = []
-        for day in week:
-            if day == 0:
-                cells.append(html.Td("", style={"padding": "4px", "minWidth": "50px", "minHeight": "55px"}))
-            else:
-                day_date = dt.date(year, month, day)
-                moon_em = get_moon_emoji(day_date)
-                badges = get_day_badges(day_date)
-                badge_str = " ".join(badges)
-
-                style = {
-                    "textAlign": "center",
-                    "padding": "4px 2px",
-                    "cursor": "pointer",
-                    "minWidth": "50px",
-                    "minHeight": "55px",
-                    "verticalAlign": "top",
-                    "userSelect": "none",
-                    "borderRadius": "6px",
-                }
-                if day == selected_day:
-                    style["border"] = "2px solid #ffc107"
-                    style["backgroundColor"] = "rgba(255, 193, 7, 0.15)"
-
-                cell_children = [
-                    html.Div(str(day), style={"fontSize": "0.95rem", "fontWeight": "bold" if day == selected_day else "normal"}),
-                    html.Div(moon_em, style={"fontSize": "1.1rem", "lineHeight": "1"}),
-                ]
-                if badge_str:
-                    cell_children.append(
-                        html.Div(badge_str, style={"fontSize": "0.75rem", "lineHeight": "1"})
-                    )
-
-                cells.append(html.Td(
-                    cell_children,
-                    style=style,
-                    id={"type": "day-cell", "day": day},
-                    n_clicks=0,
-                ))
+    rows = [_HEADER_ROW]
+    for week, template in zip(month_payload(year, month), _month_template(year, month)):
+        cells = list(template)
+        for i, cell in enumerate(week):
+            if cell is not None and cell["day"] == selected_day:
+                cells[i] = _day_cell(cell, True)
         rows.append(html.Tr(cells))
 
-    return html.Table(rows, style={"width": "100%", "borderCollapse": "collapse"})
+    # Keyed per month so React remounts the table rather than patching cells whose
+    # selection class was moved in the browser
+    return html.Table(rows, key=f"{year}-{month}", className="calendar-table")
+
+
+# Day panel styles, shared by every render
+PHASE_LINE_STYLE = {"fontSize": "1.1rem"}
+NEW_YEAR_LINE_STYLE = {"color": "#ffc107", "fontWeight": "bold", "fontSize": "1.1rem"}
+NEW_MOON_LINE_STYLE = {"color": "#17a2b8", "fontWeight": "bold"}
+SABBATH_LINE_STYLE = {"color": "#6ea8fe"}
+FEAST_TITLE_STYLE = {"color": "#75b798"}
+SCRIPTURE_STYLE = {"whiteSpace": "pre-wrap"}
+
+
+def _feast_panel(feast):
+    """Build the feast section of the day panel: name, description and scripture accordion."""
+    children = [html.H5(f"{FEAST_EMOJI} {feast.name}", style=FEAST_TITLE_STYLE)]
+    if feast.description:
+        children.append(html.P(feast.description))
+    if feast.bible_refs:
+        children.append(dbc.Accordion(
+            [dbc.AccordionItem(
+                html.P(SCRIPTURE_TEXT.get(ref, ""), style=SCRIPTURE_STYLE),
+                title=ref,
+            ) for ref in feast.bible_refs],
+            start_collapsed=True,
+            always_open=True,
+            flush=True,
+            className="mt-2",
+        ))
+    return html.Div(children)
 
 
-def get_day_info(day_date):
+def get_day_info(day_date: dt.date) -> List:
     """Get information about a specific day."""
-    phase, angle = get_moon_phase(dt.datetime.combine(day_date, dt.time(12, 0)))
-    moon_em = MOON_EMOJI.get(phase, "")
+    return list(_day_info(day_date.toordinal()))
+
+
+@functools.lru_cache(maxsize=4096)
+def _day_info(ordinal):
+    """Return the day panel for the day with the given ordinal, as a tuple of components."""
+    day_date = dt.date.fromordinal(ordinal)
+    flags = _day_flags(ordinal)
+    meta = _tables().DAY_META.get(ordinal)
+    phase_line = meta[2] if meta else _phase_line(*_noon_phase(ordinal))
 
     info = [html.H6(day_date.strftime("%A, %d %B %Y"), className="mb-3")]
-    info.append(html.P(f"{moon_em} {phase} (angle: {angle:.1f}°)", style={"fontSize": "1.1rem"}))
+    info.append(html.P(phase_line, style=PHASE_LINE_STYLE))
 
-    if day_date in NEW_YEAR_DATES:
+    if flags & NEW_YEAR_FLAG:
         info.append(html.P(
             f"{NEW_YEAR_EMOJI} Nisan 1 — Head of the Year (Rosh HaShanah)",
-            style={"color": "#ffc107", "fontWeight": "bold", "fontSize": "1.1rem"}
+            style=NEW_YEAR_LINE_STYLE
         ))
-    if day_date in NEW_MOON_DATES:
+    if flags & NEW_MOON_FLAG:
         info.append(html.P(
             f"\U0001F311 New Moon — start of lunar month",
-            style={"color": "#17a2b8", "fontWeight": "bold"}
+            style=NEW_MOON_LINE_STYLE
         ))
-    if day_date in SABBATH_DATES:
+    if flags & SABBATH_FLAG:
         info.append(html.P(
             f"{SABBATH_EMOJI} Sabbath — day of rest",
-            style={"color": "#6ea8fe"}
+            style=SABBATH_LINE_STYLE
         ))
-    if day_date in FEAST_DATES:
-        feast = FEAST_DATES[day_date]
-        children = [html.H5(f"{FEAST_EMOJI} {feast.name}", style={"color": "#75b798"})]
-        if feast.description:
-            children.append(html.P(feast.description))
-        if feast.bible_refs:
-            children.append(dbc.Accordion(
-                [dbc.AccordionItem(
-                    html.P(SCRIPTURE_TEXT.get(ref, ""), style={"whiteSpace": "pre-wrap"}),
-                    title=ref,
-                ) for ref in feast.bible_refs],
-                start_collapsed=True,
-                always_open=True,
-                flush=True,
-                className="mt-2",
-            ))
-        info.append(html.Div(children))
-    return info
+    if flags & FEAST_FLAG:
+        tables = _tables()
+        info.append(tables.FEAST_PANELS[tables.FEAST_DATES[day_date].name])
+    return tuple(info)
+
+
+# Load the lunar tables off the import path so a cold worker can boot and bind its
+# port straight away; the first caller that needs them waits in _tables(). Submitted
+# only once everything _load_tables uses is defined.
+_TABLES_FUTURE = concurrent.futures.ThreadPoolExecutor(max_workers=1).submit(_load_tables)
 
 
 # ---------------------------------------------------------------------------
 # Layout
 # ---------------------------------------------------------------------------
 
-today = dt.date.today()
-initial_grid = create_calendar_grid(today.year, today.month, today.day)
-initial_month = today.strftime("%B %Y")
-initial_info = get_day_info(today)
-
-app.layout = dbc.Container([
-    html.H1("\U0001F319 Hebrew Calendar", className="text-center my-4"),
-    html.P("Biblical feast days, sabbaths, and new moons based on lunar calculations",
-           className="text-center text-muted mb-2"),
-    dbc.Alert(
-        "\U0001F319 Feasts and Sabbaths begin at sunset on the date shown (evening to evening)",
-        color="info",
-        className="text-center mb-3",
-        style={"fontSize": "0.9rem"}
-    ),
-    html.P("Click a day or use arrow keys (\u2190 \u2192 \u2191 \u2193) to navigate",
-           className="text-center text-muted mb-2", style={"fontSize": "0.85rem"}),
-
-    dbc.Row([
-        dbc.Col([
-            dbc.Card([
-                dbc.CardHeader([
-                    dbc.Button("\u25c0", id="prev-month", color="secondary", size="sm", className="me-2"),
-                    html.Span(initial_month, id="month-year", className="mx-3", style={"fontSize": "1.2rem"}),
-                    dbc.Button("\u25b6", id="next-month", color="secondary", size="sm", className="ms-2"),
-                ], className="d-flex justify-content-center align-items-center"),
-                dbc.CardBody(initial_grid, id="calendar-grid")
-            ])
-        ], lg=8),
-
-        dbc.Col([
-            dbc.Card([
-                dbc.CardHeader("Selected Day"),
-                dbc.CardBody(initial_info, id="day-info")
-            ]),
-            html.Div(className="mt-3"),
-            dbc.Card([
-                dbc.CardHeader("Legend"),
-                dbc.CardBody([
-                    html.Div([
-                        html.Span("\U0001F311", style={"marginRight": "8px"}),
-                        "New Moon"
-                    ], className="mb-2"),
-                    html.Div([
-                        html.Span("\U0001F313", style={"marginRight": "8px"}),
-                        "First Quarter"
-                    ], className="mb-2"),
-                    html.Div([
-                        html.Span("\U0001F315", style={"marginRight": "8px"}),
-                        "Full Moon"
-                    ], className="mb-2"),
-                    html.Div([
-                        html.Span("\U0001F317", style={"marginRight": "8px"}),
-                        "Third Quarter"
-                    ], className="mb-2"),
-                    html.Hr(),
-                    html.Div([
-                        html.Span(FEAST_EMOJI, style={"marginRight": "8px"}),
-                        "Feast Day"
-                    ], className="mb-2"),
-                    html.Div([
-                        html.Span(SABBATH_EMOJI, style={"marginRight": "8px"}),
-                        "Sabbath"
-                    ], className="mb-2"),
-                    html.Div([
-                        html.Span(NEW_YEAR_EMOJI, style={"marginRight": "8px"}),
-                        "New Year (Nisan 1)"
-                    ]),
+def _page_layout(today, initial_grid, initial_month, initial_info, day_meta=None):
+    return dbc.Container([
+        html.H1("\U0001F319 Hebrew Calendar", className="text-center my-4"),
+        html.P("Biblical feast days, sabbaths, and new moons based on lunar calculations",
+               className="text-center text-muted mb-2"),
+        dbc.Alert(
+            "\U0001F319 Feasts and Sabbaths begin at sunset on the date shown (evening to evening)",
+            color="info",
+            className="text-center mb-3",
+            style={"fontSize": "0.9rem"}
+        ),
+        html.P("Click a day or use arrow keys (\u2190 \u2192 \u2191 \u2193) to navigate",
+               className="text-center text-muted mb-2", style={"fontSize": "0.85rem"}),
+
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader([
+                        dbc.Button("\u25c0", id="prev-month", color="secondary", size="sm", className="me-2"),
+                        html.Span(initial_month, id="month-year", className="mx-3", style={"fontSize": "1.2rem"}),
+                        dbc.Button("\u25b6", id="next-month", color="secondary", size="sm", className="ms-2"),
+                    ], className="d-flex justify-content-center align-items-center"),
+                    dbc.CardBody(initial_grid, id="calendar-grid")
                 ])
-            ])
-        ], lg=4)
-    ]),
+            ], lg=8),
+
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader("Selected Day"),
+                    dbc.CardBody(initial_info, id="day-info")
+                ]),
+                html.Div(className="mt-3"),
+                dbc.Card([
+                    dbc.CardHeader("Legend"),
+                    dbc.CardBody([
+                        html.Div([
+                            html.Span("\U0001F311", style={"marginRight": "8px"}),
+                            "New Moon"
+                        ], className="mb-2"),
+                        html.Div([
+                            html.Span("\U0001F313", style={"marginRight": "8px"}),
+                            "First Quarter"
+                        ], className="mb-2"),
+                        html.Div([
+                            html.Span("\U0001F315", style={"marginRight": "8px"}),
+                            "Full Moon"
+                        ], className="mb-2"),
+                        html.Div([
+                            html.Span("\U0001F317", style={"marginRight": "8px"}),
+                            "Third Quarter"
+                        ], className="mb-2"),
+                        html.Hr(),
+                        html.Div([
+                            html.Span(FEAST_EMOJI, style={"marginRight": "8px"}),
+                            "Feast Day"
+                        ], className="mb-2"),
+                        html.Div([
+                            html.Span(SABBATH_EMOJI, style={"marginRight": "8px"}),
+                            "Sabbath"
+                        ], className="mb-2"),
+                        html.Div([
+                            html.Span(NEW_YEAR_EMOJI, style={"marginRight": "8px"}),
+                            "New Year (Nisan 1)"
+                        ]),
+                    ])
+                ])
+            ], lg=4)
+        ]),
+
+        # Stores
+        dcc.Store(id="current-date", data=today.isoformat()),
+        # Last key or day-cell event as "key:<direction>:<ts>" / "day:<n>:<ts>"
+        dcc.Store(id="nav-event", data=""),
+        dcc.Store(id="day-meta", data=day_meta),
+    ], fluid=True, className="py-4")
+
+
+def serve_layout():
+    """Build the page around today's date; Dash calls this on every page load."""
+    today = dt.date.today()
+    return _page_layout(today, create_calendar_grid(today.year, today.month, today.day),
+                        month_name(today.year, today.month), get_day_info(today), day_meta_payload())
+
 
-    # Stores
-    dcc.Store(id="current-date", data={"year": today.year, "month": today.month, "day": today.day}),
-    dcc.Store(id="key-press", data=0),
-    dcc.Store(id="key-direction", data=""),
-], fluid=True, className="py-4")
+# Dash validates a layout function by calling it on assignment, which would wait for the
+# lunar tables at import; validate against the same page shell without content instead.
+app.validation_layout = _page_layout(dt.date.today(), None, "", None)
+app.layout = serve_layout
 
 
 # ---------------------------------------------------------------------------
-# Clientside JS for keyboard arrow capture
+# Clientside JS for keyboard arrow capture, day clicks and month navigation
+# (navigation and grid rendering live in assets/calendar.js)
 # ---------------------------------------------------------------------------
 
 app.clientside_callback(
@@ -283,16 +487,52 @@ app.clientside_callback(
                 else if (e.key === 'ArrowUp') dir = 'up';
                 if (dir) {
                     e.preventDefault();
-                    window.dash_clientside.set_props('key-direction', {data: dir});
-                    window.dash_clientside.set_props('key-press', {data: Date.now()});
+                    window.dash_clientside.set_props('nav-event', {data: 'key:' + dir + ':' + Date.now()});
                 }
             });
+            // One delegated listener on the grid container instead of a callback input per cell
+            document.getElementById('calendar-grid').addEventListener('click', function(e) {
+                var cell = e.target.closest('td[data-day]');
+                if (cell) {
+                    window.dash_clientside.set_props('nav-event', {data: 'day:' + cell.dataset.day + ':' + Date.now()});
+                }
+            });
+        }
+        return window.dash_clientside.no_update;
+    }
+    """,
+    Output("nav-event", "id"),
+    Input("nav-event", "data"),
+)
+
+app.clientside_callback(
+    """
+    function(date) {
+        var grid = document.getElementById('calendar-grid');
+        if (grid && date) {
+            grid.querySelectorAll('td.selected').forEach(function(td) { td.classList.remove('selected'); });
+            var cell = grid.querySelector('td[data-day="' + parseInt(date.slice(8), 10) + '"]');
+            if (cell) cell.classList.add('selected');
         }
         return window.dash_clientside.no_update;
     }
     """,
-    Output("key-press", "id"),
-    Input("key-press", "data"),
+    Output("current-date", "id"),
+    Input("current-date", "data"),
+)
+
+
+app.clientside_callback(
+    ClientsideFunction(namespace="calendar", function_name="update"),
+    [Output("current-date", "data"),
+     Output("calendar-grid", "children"),
+     Output("month-year", "children")],
+    [Input("prev-month", "n_clicks"),
+     Input("next-month", "n_clicks"),
+     Input("nav-event", "data")],
+    [State("current-date", "data"),
+     State("day-meta", "data")],
+    prevent_initial_call=True,
 )
 
 
@@ -300,60 +540,29 @@ app.clientside_callback(
 # Main callback
 # ---------------------------------------------------------------------------
 
+def _month_precomputed(year, month):
+    """Whether every day of the month is in DAY_META, i.e. the browser renders its grid."""
+    first = dt.date(year, month, 1).toordinal()
+    meta = _tables().DAY_META
+    return first in meta and first + _days_in_month(year, month) - 1 in meta
+
+
 @callback(
-    [Output("calendar-grid", "children"),
-     Output("month-year", "children"),
-     Output("day-info", "children"),
-     Output("current-date", "data")],
-    [Input("prev-month", "n_clicks"),
-     Input("next-month", "n_clicks"),
-     Input({"type": "day-cell", "day": ALL}, "n_clicks"),
-     Input("key-press", "data")],
-    [State("current-date", "data"),
-     State("key-direction", "data")],
+    [Output("day-info", "children"),
+     Output("calendar-grid", "children", allow_duplicate=True),
+     Output("month-year", "children", allow_duplicate=True)],
+    Input("current-date", "data"),
+    State("month-year", "children"),
     prevent_initial_call=True,
 )
-def update_calendar(prev_clicks, next_clicks, day_clicks, key_ts, date_data, key_dir):
-    year = date_data["year"]
-    month = date_data["month"]
-    day = date_data["day"]
-
-    triggered = ctx.triggered_id
-
-    if triggered == "prev-month":
-        month -= 1
-        if month < 1:
-            month = 12
-            year -= 1
-        day = 1
-    elif triggered == "next-month":
-        month += 1
-        if month > 12:
-            month = 1
-            year += 1
-        day = 1
-    elif isinstance(triggered, dict) and triggered.get("type") == "day-cell":
-        day = triggered["day"]
-    elif triggered == "key-press" and key_dir:
-        current = dt.date(year, month, day)
-        if key_dir == "right":
-            current += dt.timedelta(days=1)
-        elif key_dir == "left":
-            current -= dt.timedelta(days=1)
-        elif key_dir == "down":
-            current += dt.timedelta(days=7)
-        elif key_dir == "up":
-            current -= dt.timedelta(days=7)
-        year, month, day = current.year, current.month, current.day
-
-    max_day = calendar.monthrange(year, month)[1]
-    day = min(day, max_day)
-
-    cal_grid = create_calendar_grid(year, month, day)
-    month_name = dt.date(year, month, 1).strftime("%B %Y")
-    day_info = get_day_info(dt.date(year, month, day))
-
-    return cal_grid, month_name, day_info, {"year": year, "month": month, "day": day}
+def update_calendar(iso_date, shown_month=None):
+    day_date = dt.date.fromisoformat(iso_date)
+    day_info = get_day_info(day_date)
+    # The grid already on screen only needs its highlight moved, which happens clientside
+    if shown_month == month_name(day_date.year, day_date.month) or _month_precomputed(day_date.year, day_date.month):
+        return day_info, no_update, no_update
+    return (day_info, create_calendar_grid(day_date.year, day_date.month, day_date.day),
+            month_name(day_date.year, day_date.month))
 
 
 if __name__ == "__main__":
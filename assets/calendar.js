@@ -0,0 +1,120 @@
+// Month navigation and grid rendering in the browser. The server sends the
+// pre-rendered cell content for the precomputed range once (the day-meta store)
+// and afterwards only renders the day panel, plus the grid for months outside
+// that range.
+(function() {
+    var MONTH_NAMES = ["January", "February", "March", "April", "May", "June", "July",
+                       "August", "September", "October", "November", "December"];
+    var WEEKDAYS = ["Mo", "Tu", "We", "Th", "Fr", "Sa", "Su"];
+    var KEY_STEPS = {right: 1, left: -1, down: 7, up: -7};
+    var TRIGGER_EVENTS = {"prev-month.n_clicks": "prev", "next-month.n_clicks": "next"};
+
+    function el(type, props) {
+        return {type: type, namespace: "dash_html_components", props: props};
+    }
+
+    function pad(n) {
+        return (n < 10 ? "0" : "") + n;
+    }
+
+    function parseIso(iso) {
+        return {year: +iso.slice(0, 4), month: +iso.slice(5, 7), day: +iso.slice(8, 10)};
+    }
+
+    function toIso(date) {
+        return date.year + "-" + pad(date.month) + "-" + pad(date.day);
+    }
+
+    function daysInMonth(year, month) {
+        return new Date(Date.UTC(year, month, 0)).getUTCDate();
+    }
+
+    // Mirrors create_calendar_grid; returns null when any day of the month is
+    // missing from dayMeta so the server can render it instead.
+    function renderMonth(year, month, selectedDay, dayMeta) {
+        var lead = (new Date(Date.UTC(year, month - 1, 1)).getUTCDay() + 6) % 7;
+        var cells = [];
+        for (var i = 0; i < lead; i++) {
+            cells.push(el("Td", {children: "", className: "empty-cell"}));
+        }
+        var prefix = year + "-" + pad(month) + "-";
+        for (var day = 1, n = daysInMonth(year, month); day <= n; day++) {
+            var meta = dayMeta && dayMeta[prefix + pad(day)];
+            if (!meta) {
+                return null;
+            }
+            var children = [String(day), el("Div", {children: meta[0], className: "day-moon"})];
+            if (meta[1]) {
+                children.push(el("Div", {children: meta[1], className: "day-badges"}));
+            }
+            cells.push(el("Td", {
+                children: children,
+                className: day === selectedDay ? "day-cell selected" : "day-cell",
+                "data-day": day,
+            }));
+        }
+        while (cells.length % 7) {
+            cells.push(el("Td", {children: "", className: "empty-cell"}));
+        }
+        var rows = [el("Tr", {children: WEEKDAYS.map(function(d) {
+            return el("Th", {children: d, className: "weekday-header"});
+        })})];
+        for (var w = 0; w < cells.length; w += 7) {
+            rows.push(el("Tr", {children: cells.slice(w, w + 7)}));
+        }
+        return el("Table", {children: rows, key: year + "-" + month, className: "calendar-table"});
+    }
+
+    // event is "prev", "next", "day:<n>" or "key:<direction>"; anything after a
+    // second colon (the nav-event timestamp) is ignored.
+    function navigate(event, date) {
+        var parts = event.split(":");
+        var year = date.year, month = date.month, day = date.day;
+        if (parts[0] === "prev") {
+            month -= 1;
+            if (month < 1) {
+                month = 12;
+                year -= 1;
+            }
+            day = 1;
+        } else if (parts[0] === "next") {
+            month += 1;
+            if (month > 12) {
+                month = 1;
+                year += 1;
+            }
+            day = 1;
+        } else if (parts[0] === "day" && +parts[1]) {
+            day = +parts[1];
+        } else if (parts[0] === "key" && KEY_STEPS[parts[1]]) {
+            var moved = new Date(Date.UTC(year, month - 1, day + KEY_STEPS[parts[1]]));
+            year = moved.getUTCFullYear();
+            month = moved.getUTCMonth() + 1;
+            day = moved.getUTCDate();
+        }
+        return {year: year, month: month, day: Math.min(day, daysInMonth(year, month))};
+    }
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        calendar: {
+            renderMonth: renderMonth,
+            navigate: navigate,
+            update: function(prevClicks, nextClicks, navEvent, isoDate, dayMeta) {
+                var noUpdate = window.dash_clientside.no_update;
+                var triggered = window.dash_clientside.callback_context.triggered;
+                var trigger = triggered.length ? triggered[0].prop_id : "";
+                var date = parseIso(isoDate);
+                var next = navigate(TRIGGER_EVENTS[trigger] || (trigger === "nav-event.data" && navEvent) || "", date);
+                if (next.year === date.year && next.month === date.month) {
+                    // Same month: only the highlight moves, which the current-date callback handles
+                    return [next.day === date.day ? noUpdate : toIso(next), noUpdate, noUpdate];
+                }
+                var grid = renderMonth(next.year, next.month, next.day, dayMeta);
+                if (!grid) {
+                    return [toIso(next), noUpdate, noUpdate];
+                }
+                return [toIso(next), grid, MONTH_NAMES[next.month - 1] + " " + next.year];
+            },
+        },
+    });
+})();
@@ -0,0 +1,23 @@
+"""Keep the tests' disk caches out of the developer's ~/.cache.
+
+Importing app builds and pickles its data, so the session gets a fresh
+XDG_CACHE_HOME before any test module is collected; each test then gets its own,
+so results cached by one test (or one run) cannot mask a regression in another.
+"""
+import os
+import shutil
+import tempfile
+
+import pytest
+
+_SESSION_CACHE = tempfile.mkdtemp(prefix="hebrew_calendar_tests_")
+os.environ["XDG_CACHE_HOME"] = _SESSION_CACHE
+
+
+def pytest_unconfigure(config):
+    shutil.rmtree(_SESSION_CACHE, ignore_errors=True)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_disk_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
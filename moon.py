@@ -2,43 +2,152 @@
 #To calculate the phase of the moon at a given date, we need to know the date and time of the observation. We can use the Python library `Astropy` to calculate the phase of the moon. Here is an example program that calculates the phase of the moon for a given date and time:
 
 from enum import Enum
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple, Union
 from dataclasses import dataclass
-from functools import reduce
+from functools import lru_cache, wraps
+from pathlib import Path
 from astropy.time import Time
 from astropy.coordinates import get_body, get_sun
+import bisect
 import datetime as dt
+import hashlib
+import json
+import math
+import os
+import pickle
+import tempfile
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the kernels below run as plain Python without it
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+try:
+    import ephem
+except ImportError:  # ephem is optional; get_moon_phase uses astropy without it
+    ephem = None
+
+# Opt in to PyEphem for single-instant phases with HEBREW_CALENDAR_EPHEM=1. It is several
+# times faster per call and agrees with astropy to ~0.01°, but astropy stays the default
+# reference, and the batched (array Time) paths always use it.
+USE_EPHEM = ephem is not None and os.environ.get("HEBREW_CALENDAR_EPHEM") == "1"
+
+# Moon phases are evaluated at noon throughout (display, new moon detection, feast counting)
+NOON = dt.time(12, 0)
 
 def get_moon_phase(date_obs):
+    """Return (phase name, moon-sun separation in degrees) at a date or datetime.
+
+    A plain date means midnight; naive datetimes are taken as UTC and aware ones
+    are converted to it.
+    """
+    if isinstance(date_obs, dt.datetime) and date_obs.tzinfo is not None:
+        date_obs = date_obs.astimezone(dt.timezone.utc)
+    return get_moon_phase_cached(date_obs.year, date_obs.month, date_obs.day,
+                                 getattr(date_obs, 'hour', 0), getattr(date_obs, 'minute', 0),
+                                 getattr(date_obs, 'second', 0))
+
+
+@lru_cache(maxsize=8192)
+def get_moon_phase_cached(year: int, month: int, day: int, hour: int = 12,
+                          minute: int = 0, second: int = 0) -> Tuple[str, float]:
+    """get_moon_phase keyed on the (second-resolution) timestamp fields, memoized.
+
+    Callers that look up the same instants repeatedly (such as the app's per-day
+    fallback outside its precomputed range) hit the ephemeris only once for each.
+    """
+    if USE_EPHEM:
+        phase_angle = _ephem_separation(dt.datetime(year, month, day, hour, minute, second))
+        return _classify_phase(phase_angle), phase_angle
+
     # Convert the date and time to an astropy Time object
-    time_obs = Time(date_obs.strftime('%Y-%m-%d %H:%M:%S'))
+    time_obs = Time(dt.datetime(year, month, day, hour, minute, second), scale='utc')
 
     # Calculate the position of the moon and sun at the observation time
     moon = get_body("moon", time_obs)
     sun = get_body("sun", time_obs)
     # Calculate the phase angle between the moon and sun
-    phase_angle =  moon.separation(sun).degree
+    phase_angle = _body_separation(moon, sun)
+
+    return _classify_phase(phase_angle), phase_angle
+
+
+def _separations(instants: List[dt.datetime]) -> np.ndarray:
+    """Return the moon-sun separation in degrees at each naive UTC instant, in one ephemeris call."""
+    times = Time(instants, scale='utc')
+    return _body_separation(get_body("moon", times), get_body("sun", times))
+
+
+def _body_separation(moon, sun):
+    """Return moon.separation(sun) in degrees, computed on the raw RA/Dec radians.
+
+    Same Vincenty formula astropy uses, but without building the intermediate
+    Angle/Quantity objects; agrees with SkyCoord.separation to ~1e-13°.
+    """
+    ra1, dec1, ra2, dec2 = moon.ra.rad, moon.dec.rad, sun.ra.rad, sun.dec.rad
+    sin_dra, cos_dra = np.sin(ra2 - ra1), np.cos(ra2 - ra1)
+    sin_dec1, cos_dec1 = np.sin(dec1), np.cos(dec1)
+    sin_dec2, cos_dec2 = np.sin(dec2), np.cos(dec2)
+    num1 = cos_dec2 * sin_dra
+    num2 = cos_dec1 * sin_dec2 - sin_dec1 * cos_dec2 * cos_dra
+    denominator = sin_dec1 * sin_dec2 + cos_dec1 * cos_dec2 * cos_dra
+    return np.degrees(np.arctan2(np.hypot(num1, num2), denominator))
+
+
+def _ephem_separation(date_obs: dt.datetime) -> float:
+    """Return the moon-sun separation in degrees at a naive UTC datetime, using PyEphem."""
+    moon, sun = ephem.Moon(date_obs), ephem.Sun(date_obs)
+    return math.degrees(ephem.separation(moon, sun))
 
-    # Convert the phase angle to a moon phase
+
+def get_moon_phases(dates: List[dt.datetime]) -> List[Tuple[str, float]]:
+    """Vectorised get_moon_phase: evaluate the ephemeris for all dates in one call."""
+    if not dates:
+        return []
+    # Whole seconds, as get_moon_phase uses
+    angles = _separations([d.replace(microsecond=0) for d in dates])
+    return [(MOON_PHASES[bucket], angle) for bucket, angle in zip(phase_buckets(angles).tolist(), angles.tolist())]
+
+
+# Phase names in bucket order; phase_bucket() indexes into this tuple
+MOON_PHASES = ('New Moon', 'Waxing Crescent', 'First Quarter', 'Waxing Gibbous',
+               'Full Moon', 'Waning Gibbous', 'Third Quarter', 'Waning Crescent')
+
+
+def phase_bucket(phase_angle: float) -> int:
+    """Return the index (0..7) into MOON_PHASES for a moon-sun separation angle."""
     # Using 12 degrees threshold to better match traditional calendar observations
     if phase_angle <= 12.0:
-        phase = 'New Moon'
+        return 0
     elif phase_angle < 60.0:
-        phase = 'Waxing Crescent'
+        return 1
     elif phase_angle < 110.0:
-        phase = 'First Quarter'
+        return 2
     elif phase_angle < 160.0:
-        phase = 'Waxing Gibbous'
+        return 3
     elif phase_angle < 210.0:
-        phase = 'Full Moon'
+        return 4
     elif phase_angle < 260.0:
-        phase = 'Waning Gibbous'
+        return 5
     elif phase_angle < 310.0:
-        phase = 'Third Quarter'
-    else:
-        phase = 'Waning Crescent'
+        return 6
+    return 7
+
+
+# Upper bounds of buckets 0..6 for phase_buckets(). Bucket 0 includes 12° itself while
+# the others exclude their bound, hence the nudge so one side='right' search fits all.
+_PHASE_BOUNDS = np.array((np.nextafter(12.0, np.inf), 60.0, 110.0, 160.0, 210.0, 260.0, 310.0))
 
-    return phase, phase_angle
+
+def phase_buckets(phase_angles) -> np.ndarray:
+    """Vectorised phase_bucket: one searchsorted over an array of angles."""
+    return np.searchsorted(_PHASE_BOUNDS, phase_angles, side='right')
+
+
+def _classify_phase(phase_angle: float) -> str:
+    return MOON_PHASES[phase_bucket(phase_angle)]
 
 # This updated function should now detect the start of a new moon phase on only one day.
 
@@ -51,104 +160,86 @@ class Position:
 @dataclass(frozen=True)
 class FeastDay:
     lunar_month: int
-    days: List[int]
+    days: Tuple[int, ...]
     name: str
     description: Optional[str]  = None
-    bible_refs: Optional[List[str]] = None
-    link: Optional[str] = None
+    bible_refs: Optional[Tuple[str, ...]] = None
 
 class FeastDays(Enum):
     # SABBATH = FeastDay(name='Sabbath', description='A day of rest observed every seventh day.', lunar_month=1, days ='Every seventh day', bible_ref='Leviticus 23:3')
-    PASSOVER = FeastDay(name='Passover (Pesach)', description="Commemorates the Israelites' deliverance from slavery in Egypt.", lunar_month=1, days=[14], bible_refs=['Leviticus 23:5', 'Exodus 12:1-14'])
-    UNLEAVENED_BREAD = FeastDay(name='Feast of Unleavened Bread', description='A festival lasting seven days during which unleavened bread is eaten.', lunar_month=1, days=[15,16,17,18,19,20,21], bible_refs=['Leviticus 23:6-8', 'Exodus 12:15-20'])
+    PASSOVER = FeastDay(name='Passover (Pesach)', description="Commemorates the Israelites' deliverance from slavery in Egypt.", lunar_month=1, days=(14,), bible_refs=('Leviticus 23:5', 'Exodus 12:1-14'))
+    UNLEAVENED_BREAD = FeastDay(name='Feast of Unleavened Bread', description='A festival lasting seven days during which unleavened bread is eaten.', lunar_month=1, days=(15,16,17,18,19,20,21), bible_refs=('Leviticus 23:6-8', 'Exodus 12:15-20'))
     #FIRST_FRUITS = FeastDay(name='Firstfruits', description='An offering of the first fruits of the harvest.', lunar_month=1, days='Day after the Sabbath during the Feast of Unleavened Bread', bible_refs=['Leviticus 23:9-14'])
-    FEAST_OF_WEEKS = FeastDay(name='Feast of Weeks (Shavuot)', description='Celebrated fifty days after the Firstfruits. Also known as Pentecost.', lunar_month=1, days=[50], bible_refs=['Leviticus 23:15-21', 'Acts 2:1-4'])
-    FEAST_OF_TRUMPETS = FeastDay(name='Feast of Trumpets (Rosh Hashanah)', description="New Year's festival marked by the blowing of trumpets.", lunar_month=7, days=[1], bible_refs=['Leviticus 23:23-25', 'Psalm 81:3'])
-    DAY_OF_ATONEMENT = FeastDay(name='Day of Atonement (Yom Kippur)', description='A day of fasting and repentance.', lunar_month=7, days=[10], bible_refs=['Leviticus 23:26-32', 'Leviticus 16:29-34'])
-    FEAST_OF_TABERNACLES = FeastDay(name='Feast of Tabernacles (Sukkot)', description="A seven-day festival plus the 8th day assembly (Shemini Atzeret).", lunar_month=7, days=[15,16,17,18,19,20,21,22], bible_refs=['Leviticus 23:33-43', 'Zechariah 14:16-19', 'John 7:37-38', '2 Maccabees 10:6-8'])
-    PURIM = FeastDay(name='Purim', description="Commemorates the deliverance of the Jewish people from Haman's plot.", lunar_month=12, days=[14,15], bible_refs=['Esther 9:20-32', '2 Maccabees 15:36'])
-    FEAST_OF_DEDICATION = FeastDay(name='Hanukkah (Feast of Dedication)', description='Commemorates the Maccabean revolt and rededication of the Second Temple.', lunar_month=9, days=[25,26,27,28,29,30,31,32], bible_refs=['John 10:22-23', '1 Maccabees 4:36-59', '2 Maccabees 1:18'])
+    FEAST_OF_WEEKS = FeastDay(name='Feast of Weeks (Shavuot)', description='Celebrated fifty days after the Firstfruits. Also known as Pentecost.', lunar_month=1, days=(50,), bible_refs=('Leviticus 23:15-21', 'Acts 2:1-4'))
+    FEAST_OF_TRUMPETS = FeastDay(name='Feast of Trumpets (Rosh Hashanah)', description="New Year's festival marked by the blowing of trumpets.", lunar_month=7, days=(1,), bible_refs=('Leviticus 23:23-25', 'Psalm 81:3'))
+    DAY_OF_ATONEMENT = FeastDay(name='Day of Atonement (Yom Kippur)', description='A day of fasting and repentance.', lunar_month=7, days=(10,), bible_refs=('Leviticus 23:26-32', 'Leviticus 16:29-34'))
+    FEAST_OF_TABERNACLES = FeastDay(name='Feast of Tabernacles (Sukkot)', description="A seven-day festival plus the 8th day assembly (Shemini Atzeret).", lunar_month=7, days=(15,16,17,18,19,20,21,22), bible_refs=('Leviticus 23:33-43', 'Zechariah 14:16-19', 'John 7:37-38', '2 Maccabees 10:6-8'))
+    PURIM = FeastDay(name='Purim', description="Commemorates the deliverance of the Jewish people from Haman's plot.", lunar_month=12, days=(14,15), bible_refs=('Esther 9:20-32', '2 Maccabees 15:36'))
+    FEAST_OF_DEDICATION = FeastDay(name='Hanukkah (Feast of Dedication)', description='Commemorates the Maccabean revolt and rededication of the Second Temple.', lunar_month=9, days=(25,26,27,28,29,30,31,32), bible_refs=('John 10:22-23', '1 Maccabees 4:36-59', '2 Maccabees 1:18'))
 
     @staticmethod
-    def find_feast_days(year_start: dt.datetime, new_moons: List[dt.datetime] = None) -> Dict[dt.date, FeastDay]:
+    def find_feast_days(year_start: dt.datetime,
+                        new_moons: Union[List[dt.datetime], 'NewMoonTable']) -> Dict[dt.date, FeastDay]:
         """Calculate feast days for a lunar year.
 
         Args:
             year_start: The date of Nisan 1 (first month new moon)
-            new_moons: Optional precomputed list of new moon dates. If not provided,
-                       falls back to calculating moons on-the-fly (less accurate).
+            new_moons: Precomputed new moon dates covering the year, e.g. the keys of
+                       enumerate_new_moons() computed once at startup, or a NewMoonTable.
+                       Pass the same table for repeated lookups so the per-year search
+                       is cached.
         """
-        if new_moons is not None:
-            return FeastDays._find_feast_days_from_moons(year_start, new_moons)
-        # Fallback to old method
-        result = {add_months_and_days(lunar_year_start=year_start, months=fd.value.lunar_month, days=d):fd.value for fd in FeastDays for d in fd.value.days}
-        return result
+        return FeastDays._find_feast_days_from_moons(year_start, new_moons)
 
     @staticmethod
-    def _find_feast_days_from_moons(nisan_new_moon: dt.datetime, new_moons: List[dt.datetime]) -> Dict[dt.date, FeastDay]:
-        """Calculate feast days using precomputed new moon dates.
+    def find_feast_days_batch(year_starts: List[dt.datetime],
+                              new_moons: Union[List[dt.datetime], 'NewMoonTable']) -> Dict[dt.date, FeastDay]:
+        """Calculate feast days for several lunar years in one pass.
 
-        Handles leap years: In a leap year, there's an extra month between Elul (month 6)
-        and Tishri (month 7). This is detected by checking whether using 7 months from Nisan
-        would place Tishri significantly closer to the autumn equinox while still before it.
+        Equivalent to merging find_feast_days(start, new_moons) for each start, but the
+        new moons are sorted once and every year's autumn equinox comes from a single
+        ephemeris call.
         """
-        sorted_moons = sorted(new_moons)
-
-        # Find the index of Nisan in the sorted moon list
-        nisan_idx = None
-        for i, m in enumerate(sorted_moons):
-            if m.date() == nisan_new_moon.date():
-                nisan_idx = i
-                break
-
-        if nisan_idx is None:
-            # Fallback: find closest moon
-            for i, m in enumerate(sorted_moons):
-                if abs((m - nisan_new_moon).days) <= 1:
-                    nisan_idx = i
-                    break
-
-        if nisan_idx is None:
-            return {}
-
-        # Determine if this is a leap year
-        # Compare where Tishri would fall with 6 months vs 7 months from Nisan
-        nisan_year = nisan_new_moon.year
-        autumn_eq = get_autumn_equinox(nisan_year)
-
-        # Calculate Tishri candidates (6 and 7 months from Nisan)
-        tishri_6_idx = nisan_idx + 6
-        tishri_7_idx = nisan_idx + 7
+        table = NewMoonTable.from_new_moons(new_moons)
+        equinoxes = get_autumn_equinoxes(sorted({start.year for start in year_starts}))
+        result = {}
+        for start in year_starts:
+            result.update(FeastDays._feast_days_for_year(start, table, equinoxes[start.year]))
+        return result
 
-        leap_offset = 0
-        if tishri_6_idx < len(sorted_moons) and tishri_7_idx < len(sorted_moons):
-            tishri_6 = sorted_moons[tishri_6_idx].date()
-            tishri_7 = sorted_moons[tishri_7_idx].date()
+    @staticmethod
+    def _find_feast_days_from_moons(nisan_new_moon: dt.datetime,
+                                    new_moons: Union[List[dt.datetime], 'NewMoonTable']) -> Dict[dt.date, FeastDay]:
+        """Calculate feast days using precomputed new moon dates."""
+        return FeastDays._feast_days_for_year(nisan_new_moon, NewMoonTable.from_new_moons(new_moons),
+                                              get_autumn_equinox(nisan_new_moon.year))
 
-            days_6_before_eq = (autumn_eq - tishri_6).days
-            days_7_before_eq = (autumn_eq - tishri_7).days
+    @staticmethod
+    def _feast_days_for_year(nisan_new_moon: dt.datetime, table: 'NewMoonTable',
+                             autumn_eq: dt.date) -> Dict[dt.date, FeastDay]:
+        """Calculate one year's feast days from the new moon table and that year's autumn equinox.
 
-            # Use leap year (7 months) if:
-            # 1. The 7-month Tishri is still before or at the equinox (not after)
-            # 2. The 7-month Tishri is within 5 days of the equinox (very close)
-            # This matches the observational pattern where leap months are added
-            # to keep Tishri close to the autumn equinox
-            if days_7_before_eq >= 0 and days_7_before_eq <= 5:
-                leap_offset = 1
+        Handles leap years: In a leap year, there's an extra month between Elul (month 6)
+        and Tishri (month 7). _year_layout detects this by checking whether using 7 months from
+        Nisan would place Tishri significantly closer to the autumn equinox while still before it.
+        """
+        layout = _year_layout(nisan_new_moon, table, autumn_eq)
+        if layout is None:
+            return {}
+        nisan_idx, leap_offset = layout
 
         result = {}
-        for fd in FeastDays:
+        for month_num, days, feast in _FEAST_ROWS:
             # Month index: Nisan is month 1, so month N is at nisan_idx + (N-1)
             # For months 7+, add leap_offset if it's a leap year
-            month_num = fd.value.lunar_month
             if month_num >= 7:
                 month_idx = nisan_idx + month_num - 1 + leap_offset
             else:
                 month_idx = nisan_idx + month_num - 1
 
-            if month_idx < len(sorted_moons):
-                month_start = sorted_moons[month_idx]
-                for day in fd.value.days:
+            if month_idx < len(table):
+                month_start = table.datetimes[month_idx]
+                for day in days:
                     # For Nisan (month 1): the new moon appears at night, so the
                     # first DAY of the month is the next day. "The fourteenth day
                     # of the first month" = new_moon + 14. Use 'day' offset.
@@ -158,10 +249,56 @@ class FeastDays(Enum):
                         feast_date = month_start + dt.timedelta(days=day)
                     else:
                         feast_date = month_start + dt.timedelta(days=day - 1)
-                    result[feast_date] = fd.value
+                    result[feast_date] = feast
         return result
 
 
+# (lunar_month, days, FeastDay) for every feast, unpacked once for _feast_days_for_year
+_FEAST_ROWS = tuple((fd.value.lunar_month, tuple(fd.value.days), fd.value) for fd in FeastDays)
+
+
+@lru_cache(maxsize=256)
+def _year_layout(nisan_new_moon: dt.datetime, table: 'NewMoonTable',
+                 autumn_eq: dt.date) -> Optional[Tuple[int, int]]:
+    """Return (nisan_idx, leap_offset) for one year, or None when Nisan is not in the table.
+
+    Cached per table so repeated feast lookups for the same year skip the search; tables
+    hash by identity, and the cache keeps them alive so an id is never reused.
+    """
+    # Find the index of Nisan in the sorted moon list
+    nisan_idx = None
+    i = table.index_of(nisan_new_moon)
+    if i < len(table) and table.ordinals[i] == nisan_new_moon.toordinal():
+        nisan_idx = i
+
+    if nisan_idx is None:
+        # Fallback: the first moon within a day of Nisan, i.e. abs((m - nisan).days) <= 1
+        i = bisect.bisect_left(table.datetimes, nisan_new_moon - dt.timedelta(days=1))
+        if i < len(table) and table.datetimes[i] - nisan_new_moon < dt.timedelta(days=2):
+            nisan_idx = i
+
+    if nisan_idx is None:
+        return None
+
+    # Determine if this is a leap year
+    # Compare where Tishri would fall with 6 months vs 7 months from Nisan
+    # Calculate Tishri candidates (6 and 7 months from Nisan)
+    tishri_6_idx = nisan_idx + 6
+    tishri_7_idx = nisan_idx + 7
+
+    leap_offset = 0
+    if tishri_6_idx < len(table) and tishri_7_idx < len(table):
+        days_7_before_eq = autumn_eq.toordinal() - int(table.ordinals[tishri_7_idx])
+
+        # Use leap year (7 months) if:
+        # 1. The 7-month Tishri is still before or at the equinox (not after)
+        # 2. The 7-month Tishri is within 5 days of the equinox (very close)
+        # This matches the observational pattern where leap months are added
+        # to keep Tishri close to the autumn equinox
+        if days_7_before_eq >= 0 and days_7_before_eq <= 5:
+            leap_offset = 1
+    return nisan_idx, leap_offset
+
 
 class Location(Enum):
     NEW_YORK = Position(40.7128, -74.0060)
@@ -185,68 +322,103 @@ def calculate_sunset(date_obs: dt.datetime, location: Location):
 
 
 
-def add_months_and_days(lunar_year_start: dt.datetime, months: int, days: int) -> dt.date:
-
-    """Returns a date that is the given number of new moons (months)
-    and additional days away from the start date."""
-
-    date_cursor = lunar_year_start
-    lunar_months_counted = 0
-    yesterday_phase, _ = get_moon_phase(_at_noon(date_cursor - dt.timedelta(days=1)))
-
-    # Count the number of new moons for the given months
-    while lunar_months_counted < months-1:
-        current_phase, _ = get_moon_phase(_at_noon(date_cursor))
-
-        if current_phase == 'New Moon' and yesterday_phase != 'New Moon':
-            lunar_months_counted += 1
-            if lunar_months_counted < months-1:
-                date_cursor += dt.timedelta(days=28)
-
-        yesterday_phase = current_phase
-        date_cursor += dt.timedelta(days=1)
-
-    # Add the remaining days
-    return date_cursor + dt.timedelta(days=days)
-
-
 def _at_noon(d: dt.datetime) -> dt.datetime:
     """Return the same date at noon UTC, matching the time used for emoji display."""
     return d.replace(hour=12, minute=0, second=0, microsecond=0)
 
 
+@lru_cache(maxsize=None)
 def get_vernal_equinox(year: int) -> dt.date:
     """Return the date of the vernal equinox for a given year.
 
     Finds the first day (at noon UTC) when the sun's declination is >= 0,
     searching from March 18 onward.
     """
-    for day in range(18, 25):
-        d = dt.datetime(year, 3, day, 12, 0, 0)
-        t = Time(d.strftime('%Y-%m-%d %H:%M:%S'))
-        sun = get_sun(t)
-        if sun.dec.degree >= 0:
-            return d.date()
-    return dt.date(year, 3, 20)  # fallback
+    return get_vernal_equinoxes([year])[year]
 
 
+@lru_cache(maxsize=None)
 def get_autumn_equinox(year: int) -> dt.date:
     """Return the date of the autumn equinox for a given year.
 
     Finds the first day (at noon UTC) when the sun's declination goes below 0,
     searching from September 20 onward.
     """
-    for day in range(20, 27):
-        d = dt.datetime(year, 9, day, 12, 0, 0)
-        t = Time(d.strftime('%Y-%m-%d %H:%M:%S'))
-        sun = get_sun(t)
-        if sun.dec.degree <= 0:
-            return d.date()
-    return dt.date(year, 9, 22)  # fallback
+    return get_autumn_equinoxes([year])[year]
+
+
+def get_vernal_equinoxes(years: List[int]) -> Dict[int, dt.date]:
+    """Return get_vernal_equinox(year) for each year using one ephemeris call for all of them."""
+    return _first_noon_across_equator(years, 3, 18, northward=True)
+
+
+def get_autumn_equinoxes(years: List[int]) -> Dict[int, dt.date]:
+    """Return get_autumn_equinox(year) for each year using one ephemeris call for all of them."""
+    return _first_noon_across_equator(years, 9, 20, northward=False)
+
+
+def _first_noon_across_equator(years: List[int], month: int, first_day: int,
+                               northward: bool) -> Dict[int, dt.date]:
+    """For each year, the first of seven noons from month/first_day with the sun across the equator.
+
+    The seven candidate noons of every year go to get_sun in a single array Time.
+    Years where none qualifies fall back to the 20th (March) or 22nd (September).
+    """
+    years = list(years)
+    if not years:
+        return {}
+    offsets = np.arange(7)
+    days = [dt.datetime(year, month, first_day, 12) + dt.timedelta(days=int(n))
+            for year in years for n in offsets]
+    decs = get_sun(Time(days, scale='utc')).dec.degree.reshape(len(years), 7)
+    crossed = decs >= 0 if northward else decs <= 0
+    fallback = 20 if month == 3 else 22
+    return {year: (dt.date(year, month, first_day + int(np.argmax(row))) if row.any()
+                   else dt.date(year, month, fallback))
+            for year, row in zip(years, crossed)}
+
+
+# Julian Day of noon on date ordinal 0; ordinal + _JD_NOON_OFFSET is the noon JD of that date
+_JD_NOON_OFFSET = 1721425.0
+
+
+@dataclass(frozen=True, eq=False)
+class NewMoonTable:
+    """Sorted new moons as parallel arrays, built once and shared by the year-start and feast lookups.
+
+    ordinals holds each new moon's date ordinal so the searches and day counts are plain
+    integer arithmetic; jds is the Julian Day at noon of the same dates. angles is NaN
+    when the table was built from bare datetimes.
+    """
+    datetimes: Tuple[dt.datetime, ...]
+    ordinals: np.ndarray
+    jds: np.ndarray
+    angles: np.ndarray
+
+    @classmethod
+    def from_new_moons(cls, new_moons) -> 'NewMoonTable':
+        """Build from an enumerate_new_moons() dict, a list of new moon datetimes, or a table."""
+        if isinstance(new_moons, cls):
+            return new_moons
+        datetimes = tuple(sorted(new_moons))
+        ordinals = np.array([m.toordinal() for m in datetimes], dtype=np.int64)
+        if isinstance(new_moons, dict):
+            angles = np.array([new_moons[m] for m in datetimes], dtype=float)
+        else:
+            angles = np.full(len(datetimes), np.nan)
+        return cls(datetimes, ordinals, ordinals + _JD_NOON_OFFSET, angles)
+
+    def __len__(self) -> int:
+        return len(self.datetimes)
 
+    def index_of(self, day: dt.date) -> int:
+        """Index of the first new moon on or after day."""
+        return int(np.searchsorted(self.ordinals, day.toordinal()))
 
-def get_lunar_year_starts(new_moons: Dict[dt.datetime, float],
-                          start_year: int, end_year: int) -> Dict[int, dt.datetime]:
+
+def get_lunar_year_starts(new_moons: Union[Dict[dt.datetime, float], 'NewMoonTable'],
+                          start_year: int, end_year: int,
+                          prefer_astronomical: bool = True) -> Dict[int, dt.datetime]:
     """For each year, find Nisan 1 based on Passover timing relative to vernal equinox.
 
     The Hebrew year begins at Nisan 1, and Passover (Nisan 14) should fall in spring,
@@ -256,33 +428,40 @@ def get_lunar_year_starts(new_moons: Dict[dt.datetime, float],
     The rule: Use the earlier new moon (placing Passover before equinox) unless it would
     put Passover more than ~20 days before the equinox. This keeps Passover in the
     appropriate spring season while avoiding pushing it too late into April.
+
+    With prefer_astronomical=False the month is instead the one the fixed (rabbinic)
+    calendar calls Nisan: the new moon nearest nisan_1(year), so the leap years follow
+    the 19-year cycle while the dates still come from the observed new moons.
     """
     year_starts = {}
-    sorted_moons = sorted(new_moons.keys())
-
+    table = NewMoonTable.from_new_moons(new_moons)
+
+    if not prefer_astronomical:
+        for y in range(start_year, end_year + 1):
+            nisan = nisan_1(y)
+            i = table.index_of(nisan)
+            nearby = table.datetimes[max(i - 1, 0):i + 1]
+            # The molad-based date runs a few days behind the observed new moon at most
+            if nearby:
+                closest = min(nearby, key=lambda m: abs(m.date() - nisan))
+                if abs(closest.date() - nisan).days <= 15:
+                    year_starts[y] = closest
+        return year_starts
+
+    vernal_equinoxes = get_vernal_equinoxes(range(start_year, end_year + 1))
     for y in range(start_year, end_year + 1):
-        vernal_eq = get_vernal_equinox(y)
+        vernal_eq = vernal_equinoxes[y]
 
         # Find the two new moons that bracket the vernal equinox
-        candidate_before = None
-        candidate_after = None
-
-        for m in sorted_moons:
-            if m.date() < vernal_eq:
-                candidate_before = m
-            elif candidate_after is None:
-                candidate_after = m
-                break
+        i = table.index_of(vernal_eq)
+        candidate_before = table.datetimes[i - 1] if i > 0 else None
+        candidate_after = table.datetimes[i] if i < len(table) else None
 
         if candidate_before is None:
             continue
 
-        # Calculate when Passover (Nisan 14) would fall for each candidate
-        passover_before = candidate_before + dt.timedelta(days=13)
-        passover_after = candidate_after + dt.timedelta(days=13) if candidate_after else None
-
-        # Days before equinox for the earlier candidate's Passover
-        days_before_eq = (vernal_eq - passover_before.date()).days
+        # Days before equinox for the earlier candidate's Passover (Nisan 14, 13 days on)
+        days_before_eq = vernal_eq.toordinal() - (int(table.ordinals[i - 1]) + 13)
 
         # Prefer the earlier new moon unless Passover would be more than 20 days
         # before the equinox (which would make it too early in the season)
@@ -296,60 +475,343 @@ def get_lunar_year_starts(new_moons: Dict[dt.datetime, float],
     return year_starts
 
 
+# The fixed (rabbinic) Hebrew calendar, after Reingold & Dershowitz, "Calendrical
+# Calculations", chapter 8. Python date ordinals are their R.D. fixed dates.
+_HEBREW_EPOCH = -1373427  # R.D. of 1 Tishri AM 1
+
+
+def _hebrew_elapsed_days(hebrew_year: int) -> int:
+    """Days from the epoch to the molad of Tishri of hebrew_year, after the first postponement."""
+    months_elapsed = (235 * hebrew_year - 234) // 19
+    parts_elapsed = 12084 + 13753 * months_elapsed
+    days = 29 * months_elapsed + parts_elapsed // 25920
+    return days + 1 if (3 * (days + 1)) % 7 < 3 else days
+
+
+def _hebrew_new_year(hebrew_year: int) -> int:
+    """R.D. of 1 Tishri of hebrew_year, applying the remaining year-length postponements."""
+    previous, current, following = (_hebrew_elapsed_days(y) for y in
+                                    (hebrew_year - 1, hebrew_year, hebrew_year + 1))
+    if following - current == 356:
+        correction = 2
+    elif current - previous == 382:
+        correction = 1
+    else:
+        correction = 0
+    return _HEBREW_EPOCH + current + correction
+
+
+def tishri_1(year: int) -> dt.date:
+    """Return 1 Tishri (Rosh Hashanah) of the fixed Hebrew calendar falling in Gregorian year."""
+    return dt.date.fromordinal(_hebrew_new_year(year + 3761))
+
+
+def nisan_1(year: int) -> dt.date:
+    """Return 1 Nisan of the fixed Hebrew calendar falling in Gregorian year.
+
+    Nisan to Elul always total 177 days (30 + 29 + 30 + 29 + 30 + 29), so it is
+    found by counting back from the following Tishri.
+    """
+    return tishri_1(year) - dt.timedelta(days=177)
+
+
+# Meeus, "Astronomical Algorithms" (2nd ed.), chapter 49: periodic terms for the
+# instant of a new moon as (coefficient, power of E, M, M', F, Omega) multipliers.
+_NEW_MOON_TERMS = np.array((
+    (-0.40720, 0, 0, 1, 0, 0), (0.17241, 1, 1, 0, 0, 0), (0.01608, 0, 0, 2, 0, 0),
+    (0.01039, 0, 0, 0, 2, 0), (0.00739, 1, -1, 1, 0, 0), (-0.00514, 1, 1, 1, 0, 0),
+    (0.00208, 2, 2, 0, 0, 0), (-0.00111, 0, 0, 1, -2, 0), (-0.00057, 0, 0, 1, 2, 0),
+    (0.00056, 1, 1, 2, 0, 0), (-0.00042, 0, 0, 3, 0, 0), (0.00042, 1, 1, 0, 2, 0),
+    (0.00038, 1, 1, 0, -2, 0), (-0.00024, 1, -1, 2, 0, 0), (-0.00017, 0, 0, 0, 0, 1),
+    (-0.00007, 0, 2, 1, 0, 0), (0.00004, 0, 0, 2, -2, 0), (0.00004, 0, 3, 0, 0, 0),
+    (0.00003, 0, 1, 1, -2, 0), (0.00003, 0, 0, 2, 2, 0), (-0.00003, 0, 1, 1, 2, 0),
+    (0.00003, 0, -1, 1, 2, 0), (-0.00002, 0, -1, 1, -2, 0), (-0.00002, 0, 1, 3, 0, 0),
+    (0.00002, 0, 0, 4, 0, 0),
+))
+# Planetary arguments A2..A14 as (constant, rate per lunation, coefficient); A1
+# carries an extra T**2 term and is applied separately.
+_PLANETARY_TERMS = np.array((
+    (251.88, 0.016321, 0.000165),
+    (251.83, 26.651886, 0.000164), (349.42, 36.412478, 0.000126),
+    (84.66, 18.206239, 0.000110), (141.74, 53.303771, 0.000062),
+    (207.14, 2.453732, 0.000060), (154.84, 7.306860, 0.000056),
+    (34.52, 27.261239, 0.000047), (207.19, 0.121824, 0.000042),
+    (291.34, 1.844379, 0.000040), (161.72, 24.198154, 0.000037),
+    (239.56, 25.513099, 0.000035), (331.55, 3.592518, 0.000023),
+))
+
+SYNODIC_MONTH = 29.530588861
+_JD_UNIX_EPOCH = 2440587.5
+
+
+@njit(cache=True, fastmath=True)
+def _new_moon_jde(k: int) -> float:
+    """Return the Julian Ephemeris Day of the new moon with lunation number ``k``.
+
+    k=0 is the new moon of 6 January 2000. Accurate to within a few minutes, which
+    is ample for picking calendar days.
+    """
+    t = k / 1236.85
+    jde = (2451550.09766 + SYNODIC_MONTH * k + 0.00015437 * t**2
+           - 0.000000150 * t**3 + 0.00000000073 * t**4)
+    e = 1 - 0.002516 * t - 0.0000074 * t**2
+    m = math.radians(2.5534 + 29.10535670 * k - 0.0000014 * t**2 - 0.00000011 * t**3)
+    mp = math.radians(201.5643 + 385.81693528 * k + 0.0107582 * t**2
+                      + 0.00001238 * t**3 - 0.000000058 * t**4)
+    f = math.radians(160.7108 + 390.67050284 * k - 0.0016118 * t**2
+                     - 0.00000227 * t**3 + 0.000000011 * t**4)
+    omega = math.radians(124.7746 - 1.56375588 * k + 0.0020672 * t**2 + 0.00000215 * t**3)
+
+    for coef, e_pow, a, b, c, d in _NEW_MOON_TERMS:
+        jde += coef * e**e_pow * math.sin(a * m + b * mp + c * f + d * omega)
+
+    jde += 0.000325 * math.sin(math.radians(299.77 + 0.107408 * k - 0.009173 * t**2))
+    for const, rate, coef in _PLANETARY_TERMS:
+        jde += coef * math.sin(math.radians(const + rate * k))
+    return jde
+
+
+def _jd_to_datetime(jd: float) -> dt.datetime:
+    """Convert a Julian Day to a naive UTC datetime (TT - UTC, about a minute, is ignored)."""
+    return dt.datetime(1970, 1, 1) + dt.timedelta(days=jd - _JD_UNIX_EPOCH)
+
+
+def _datetime_to_jd(d: dt.datetime) -> float:
+    return (d - dt.datetime(1970, 1, 1)).total_seconds() / 86400.0 + _JD_UNIX_EPOCH
+
+
+# Worst-case error of approximate_separation() against the astropy separation, with
+# headroom: 0.55° was the largest deviation over 2024-2034 at noon.
+APPROX_SEPARATION_ERROR = 1.0
+
+
+@njit(cache=True)
+def approximate_separation(jd):
+    """Return the approximate moon-sun separation in degrees at Julian Day ``jd``.
+
+    Closed-form: the mean elongation, anomalies and argument of latitude (Meeus,
+    chapter 47) with the largest periodic terms in elongation and lunar latitude.
+    Works on scalars and NumPy arrays alike. It is within APPROX_SEPARATION_ERROR of
+    the ephemeris, which is not enough to decide days right at a threshold, so it
+    is only used to rule out days that are clearly on one side of one.
+    """
+    t = (jd - 2451545.0) / 36525
+    d = np.radians(297.8501921 + 445267.1114034 * t - 0.0018819 * t**2)
+    m = np.radians(357.5291092 + 35999.0502909 * t - 0.0001536 * t**2)
+    mp = np.radians(134.9633964 + 477198.8675055 * t + 0.0087414 * t**2)
+    f = np.radians(93.2720950 + 483202.0175233 * t - 0.0036539 * t**2)
+    elongation = np.radians(np.degrees(d) + 6.289 * np.sin(mp) - 2.100 * np.sin(m)
+                            + 1.274 * np.sin(2 * d - mp) + 0.658 * np.sin(2 * d)
+                            + 0.214 * np.sin(2 * mp) + 0.110 * np.sin(d))
+    latitude = np.radians(5.128 * np.sin(f) + 0.281 * np.sin(mp + f)
+                          + 0.278 * np.sin(mp - f) + 0.173 * np.sin(2 * d - f))
+    return np.degrees(np.arccos(np.cos(latitude) * np.cos(elongation)))
+
+
+# Hash of this module's source, taken once at import. Every disk cache key includes
+# it, so any change to moon.py invalidates the pickles built by the old code.
+SOURCE_HASH = hashlib.sha256(Path(__file__).read_bytes()).digest()
+# Pickles kept per cache name; beyond this the least recently used are deleted
+DISK_CACHE_LIMIT = 32
+
+
+def disk_cache_path(name: str, *key_parts) -> Path:
+    """Return the pickle path for name and key_parts under $XDG_CACHE_HOME/hebrew_calendar."""
+    key = hashlib.sha256(SOURCE_HASH)
+    key.update(repr(key_parts).encode())
+    cache_dir = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "hebrew_calendar"
+    return cache_dir / f"{name}_{key.hexdigest()[:16]}.pkl"
+
+
+def load_or_build_pickle(path: Path, build, limit: int = DISK_CACHE_LIMIT):
+    """Return the object pickled at path, or build() it and pickle it there.
+
+    A hit refreshes the file's mtime; after a write, all but the `limit` most recently
+    used pickles of the same name are deleted. Cache I/O failures only cost a rebuild.
+    """
+    try:
+        with open(path, "rb") as f:
+            result = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
+    else:
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return result
+
+    result = build()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so concurrent processes never read a partial pickle
+        with tempfile.NamedTemporaryFile("wb", dir=path.parent, delete=False) as f:
+            pickle.dump(result, f)
+        os.replace(f.name, path)
+        _prune_disk_cache(path, limit)
+    except OSError:
+        pass
+    return result
+
+
+def _prune_disk_cache(path: Path, limit: int) -> None:
+    """Delete all but the `limit` most recently used pickles sharing path's name."""
+    name = path.name.rsplit("_", 1)[0]
+    entries = sorted(path.parent.glob(f"{name}_*.pkl"), key=lambda p: p.stat().st_mtime, reverse=True)
+    for stale in entries[limit:]:
+        stale.unlink(missing_ok=True)
+
+
+def _disk_cached(func):
+    """Persist func's result per argument tuple across processes (see load_or_build_pickle)."""
+    @wraps(func)
+    def wrapper(*args):
+        return load_or_build_pickle(disk_cache_path(func.__name__, *args), lambda: func(*args))
+    return wrapper
+
+
+# Noon separations within 13.9° for every day of BUNDLED_NEW_MOON_RANGE, written by
+# tools/build_new_moon_table.py, so ranges inside it need no ephemeris call
+BUNDLED_NEW_MOON_PATH = Path(__file__).resolve().parent / "data" / "new_moons_2020_2040.json"
+BUNDLED_NEW_MOON_RANGE = (dt.date(2020, 1, 1), dt.date(2040, 12, 31))
+
+
+@lru_cache(None)
+def _bundled_new_moon_days() -> Optional[Tuple[List[dt.date], List[float]]]:
+    """Load the bundled table as parallel (sorted dates, angles) lists, or None if it is missing."""
+    try:
+        with open(BUNDLED_NEW_MOON_PATH) as f:
+            raw = json.load(f)
+    except (OSError, ValueError):
+        return None
+    days = sorted(raw)
+    return [dt.date.fromisoformat(d) for d in days], [raw[d] for d in days]
+
+
+def _bundled_new_moons(start_date: dt.datetime, end_date: dt.datetime) -> Optional[Dict[dt.datetime, float]]:
+    """Answer enumerate_new_moons(start_date, end_date) from the bundled table.
+
+    Returns None when the range is not inside BUNDLED_NEW_MOON_RANGE. Like the live
+    search, each run of days within 13.9° yields its first day inside the range.
+    """
+    first = start_date.date()
+    last = first + dt.timedelta(days=(end_date - start_date).days)
+    bundled = _bundled_new_moon_days()
+    if bundled is None or first < BUNDLED_NEW_MOON_RANGE[0] or last > BUNDLED_NEW_MOON_RANGE[1]:
+        return None
+    days, angles = bundled
+    result = {}
+    previous = None
+    for i in range(bisect.bisect_left(days, first), bisect.bisect_right(days, last)):
+        # Runs are a day or two long and a month apart, so any larger gap starts a new one
+        if previous is None or (days[i] - previous).days > 5:
+            result[start_date + (days[i] - first)] = angles[i]
+        previous = days[i]
+    return result
+
+
 def enumerate_new_moons(start_date: dt.datetime, end_date: dt.datetime) -> Dict[dt.datetime,float]:
-    """Count the number of new moons from start_date to end_date."""
-    date_cursor = start_date
-    new_moon_count = 0
+    """Find the first day of each new moon from start_date to end_date.
+
+    A day belongs to a new moon when the moon-sun separation at noon is within
+    13.9°, a wider threshold than the 12° used for display. This catches new moons
+    where the conjunction occurs in the evening/night: the angle at noon is still
+    above 12° but the moon is observationally new by sunset. The 13.9° threshold
+    matches observational reference data without producing false-early detections.
+
+    Rather than testing every day, each conjunction is predicted with the Meeus
+    lunation series and only the days around it are checked against the ephemeris,
+    all of them in a single vectorised call. Ranges within BUNDLED_NEW_MOON_RANGE
+    are read from the bundled table instead, and other ranges from the disk cache
+    when a previous run searched them.
+    """
+    bundled = _bundled_new_moons(start_date, end_date)
+    if bundled is not None:
+        return bundled
+    return _search_new_moons(start_date, end_date)
+
+
+@_disk_cached
+def _search_new_moons(start_date: dt.datetime, end_date: dt.datetime) -> Dict[dt.datetime, float]:
+    """enumerate_new_moons computed against the ephemeris, ignoring the bundled table."""
+    span = (end_date - start_date).days
+    offsets, windows = _new_moon_candidates(_datetime_to_jd(dt.datetime.combine(start_date.date(), dt.time())), span)
+    if not len(offsets):
+        return {}
+    candidates = offsets.tolist()
+    angles = _separations([_at_noon(start_date + dt.timedelta(days=n)) for n in candidates])
+
     result = dict()
+    for n, window, angle in zip(candidates, windows.tolist(), angles):
+        # Candidates are in day order, so the first hit in a window is its new moon
+        if angle <= 13.9 and window not in result:
+            result[window] = (start_date + dt.timedelta(days=n), angle)
+    return dict(result.values())
 
-    while date_cursor <= end_date:
-        # Check phase at noon using a wider threshold (13.9°) than the display
-        # threshold (12°). This catches new moons where the conjunction occurs
-        # in the evening/night — the angle at noon is still above 12° but the
-        # moon is observationally new by sunset. The 13.9° threshold matches
-        # observational reference data without producing false-early detections.
-        noon = _at_noon(date_cursor)
-        time_obs = Time(noon.strftime('%Y-%m-%d %H:%M:%S'))
-        moon_pos = get_body("moon", time_obs)
-        sun_pos = get_body("sun", time_obs)
-        angle = moon_pos.separation(sun_pos).degree
-        if angle <= 13.9:
-            # Walk backwards to find the FIRST day of this new moon
-            first_day = date_cursor
-            first_angle = angle
-            while first_day > start_date:
-                prev_day = first_day - dt.timedelta(days=1)
-                prev_noon = _at_noon(prev_day)
-                prev_t = Time(prev_noon.strftime('%Y-%m-%d %H:%M:%S'))
-                prev_moon = get_body("moon", prev_t)
-                prev_sun = get_body("sun", prev_t)
-                prev_angle = prev_moon.separation(prev_sun).degree
-                if prev_angle <= 13.9:
-                    first_day = prev_day
-                    first_angle = prev_angle
-                else:
-                    break
-
-            new_moon_count += 1
-            result[first_day] = first_angle
-            # Move forward by approximately one lunar cycle to find the next new moon
-            date_cursor = first_day + dt.timedelta(days=29)
-        else:
-            # Increment day by day to check the next date
-            date_cursor += dt.timedelta(days=1)
-    return result
+
+@njit(cache=True)
+def _new_moon_candidates(midnight_jd: float, span: int):
+    """Return the day offsets (0..span) from midnight_jd worth checking for a new moon.
+
+    Each conjunction is predicted with the Meeus lunation series; the separation stays
+    within 13.9° for at most ~1.4 days either side of it, so the first such noon lies
+    within two days. Days that approximate_separation puts clearly outside 13.9° are
+    dropped. Returns (offsets, window) arrays, window numbering the conjunctions.
+    """
+    size = (span // 29 + 4) * 5
+    offsets = np.empty(size, np.int64)
+    windows = np.empty(size, np.int64)
+    count = 0
+    k = math.floor((midnight_jd - 2451550.09766) / SYNODIC_MONTH) - 1
+    window = 0
+    while True:
+        offset = math.floor(_new_moon_jde(k) - midnight_jd)
+        k += 1
+        if offset - 2 > span:
+            break
+        for n in range(max(offset - 2, 0), min(offset + 2, span) + 1):
+            if approximate_separation(midnight_jd + n + 0.5) <= 13.9 + APPROX_SEPARATION_ERROR:
+                offsets[count] = n
+                windows[count] = window
+                count += 1
+        window += 1
+    return offsets[:count], windows[:count]
+
+
+def new_moons_from_separations(days: List[dt.datetime], angles) -> Dict[dt.datetime, float]:
+    """Pick the new moons out of the noon moon-sun separations of consecutive days.
+
+    Same rule as enumerate_new_moons: a new moon is the first day of each run of days
+    whose separation is within 13.9°.
+    """
+    within = np.asarray(angles) <= 13.9
+    run_starts = np.flatnonzero(within & ~np.concatenate(([False], within[:-1])))
+    return {days[i]: float(angles[i]) for i in run_starts}
+
+
+def enumerate_new_moons_vectorized(start_date: dt.datetime, end_date: dt.datetime) -> Dict[dt.datetime, float]:
+    """enumerate_new_moons evaluated with one ephemeris call over every noon in the range.
+
+    Cheaper than predicting each conjunction when the daily separations are needed
+    anyway, or when the range is long enough that per-call overhead dominates.
+    """
+    days = [start_date + dt.timedelta(days=n) for n in range((end_date - start_date).days + 1)]
+    angles = _separations([_at_noon(d) for d in days])
+    return new_moons_from_separations(days, angles)
 
 
 def enumerate_sabbaths(new_moons: List[dt.datetime]) -> List[dt.datetime]:
-    """Count the number of new moons from start_date to end_date."""
-    return reduce(fn, new_moons[1:], [new_moons[0]])
-
-def fn(nms: List[dt.datetime], nm: dt.datetime) -> List[dt.datetime]:
-    last_sabbath = nms[-1]
-    # Generate sabbaths at 7-day intervals using list comprehension
-    sabbaths_between = [last_sabbath + dt.timedelta(days=i)
-                        for i in range(7, (nm - last_sabbath).days, 7)]
-    return nms + sabbaths_between + [nm]
+    """Return the sabbaths: each new moon, then every seventh day until the next new moon.
+
+    new_moons must be in ascending order, as enumerate_new_moons and NewMoonTable.datetimes
+    give them; they are not re-sorted, and the sabbaths come back in ascending order.
+    """
+    sabbaths = [new_moons[0]]
+    for last_moon, new_moon in zip(new_moons, new_moons[1:]):
+        sabbaths.extend(last_moon + dt.timedelta(days=i)
+                        for i in range(7, (new_moon - last_moon).days, 7))
+        sabbaths.append(new_moon)
+    return sabbaths
 
 
 # Print the result
@@ -2,16 +2,20 @@
 #To calculate the phase of the moon at a given date, we need to know the date and time of the observation. We can use the Python library `Astropy` to calculate the phase of the moon. Here is an example program that calculates the phase of the moon for a given date and time:
 
 from enum import Enum
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 from dataclasses import dataclass
-from functools import reduce
+from itertools import pairwise
 from astropy.time import Time
 from astropy.coordinates import get_body, get_sun
+import bisect
 import datetime as dt
+import math
+
+import numpy as np
 
 def get_moon_phase(date_obs):
     # Convert the date and time to an astropy Time object
-    time_obs = Time(date_obs.strftime('%Y-%m-%d %H:%M:%S'))
+    time_obs = _time_at(date_obs)
 
     # Calculate the position of the moon and sun at the observation time
     moon = get_body("moon", time_obs)
@@ -20,25 +24,25 @@ def get_moon_phase(date_obs):
     phase_angle =  moon.separation(sun).degree
 
     # Convert the phase angle to a moon phase
-    # Using 12 degrees threshold to better match traditional calendar observations
-    if phase_angle <= 12.0:
-        phase = 'New Moon'
-    elif phase_angle < 60.0:
-        phase = 'Waxing Crescent'
-    elif phase_angle < 110.0:
-        phase = 'First Quarter'
-    elif phase_angle < 160.0:
-        phase = 'Waxing Gibbous'
-    elif phase_angle < 210.0:
-        phase = 'Full Moon'
-    elif phase_angle < 260.0:
-        phase = 'Waning Gibbous'
-    elif phase_angle < 310.0:
-        phase = 'Third Quarter'
-    else:
-        phase = 'Waning Crescent'
-
-    return phase, phase_angle
+    return MOON_PHASES[bisect.bisect_right(PHASE_BOUNDS, phase_angle)], phase_angle
+
+def _time_at(date_obs: dt.datetime) -> Time:
+    """UTC Time of a naive datetime to the whole second, built from its Julian Day.
+
+    Same instant as parsing date_obs.strftime('%Y-%m-%d %H:%M:%S'), without the
+    formatting and string parsing.
+    """
+    seconds = date_obs.hour * 3600 + date_obs.minute * 60 + date_obs.second
+    return Time(date_obs.toordinal() + _JD_OF_ORDINAL_ZERO, seconds / 86400, format='jd', scale='utc')
+
+# Julian Day of midnight at the start of date ordinal 0
+_JD_OF_ORDINAL_ZERO = 1721424.5
+
+MOON_PHASES = ('New Moon', 'Waxing Crescent', 'First Quarter', 'Waxing Gibbous',
+               'Full Moon', 'Waning Gibbous', 'Third Quarter', 'Waning Crescent')
+# Upper bound of each phase but the last; New Moon includes exactly 12 degrees, the
+# threshold that better matches traditional calendar observations
+PHASE_BOUNDS = (math.nextafter(12.0, math.inf), 60.0, 110.0, 160.0, 210.0, 260.0, 310.0)
 
 # This updated function should now detect the start of a new moon phase on only one day.
 
@@ -51,23 +55,22 @@ class Position:
 @dataclass(frozen=True)
 class FeastDay:
     lunar_month: int
-    days: List[int]
+    days: Tuple[int, ...]
     name: str
     description: Optional[str]  = None
     bible_ref: Optional[str] = None
-    link: Optional[str] = None
 
 class FeastDays(Enum):
     # SABBATH = FeastDay(name='Sabbath', description='A day of rest observed every seventh day.', lunar_month=1, days ='Every seventh day', bible_ref='Leviticus 23:3')
-    PASSOVER = FeastDay(name='Passover (Pesach)', description="Commemorates the Israelites' deliverance from slavery in Egypt.", lunar_month=1,days=[14], bible_ref='Leviticus 23:5')
-    UNLEAVENED_BREAD = FeastDay(name='Feast of Unleavened Bread', description='A festival lasting seven days during which unleavened bread is eaten.', lunar_month=1, days=[15,16,17,18,19,20,21], bible_ref='Leviticus 23:6-8')
+    PASSOVER = FeastDay(name='Passover (Pesach)', description="Commemorates the Israelites' deliverance from slavery in Egypt.", lunar_month=1,days=(14,), bible_ref='Leviticus 23:5')
+    UNLEAVENED_BREAD = FeastDay(name='Feast of Unleavened Bread', description='A festival lasting seven days during which unleavened bread is eaten.', lunar_month=1, days=(15,16,17,18,19,20,21), bible_ref='Leviticus 23:6-8')
     #FIRST_FRUITS = FeastDay(name='Firstfruits', description='An offering of the first fruits of the harvest.', lunar_month=1, days='Day after the Sabbath during the Feast of Unleavened Bread', bible_ref='Leviticus 23:9-14')
-    FEAST_OF_WEEKS = FeastDay(name='Feast of Weeks (Shavuot)', description='Celebrated fifty days after the Firstfruits. Also known as Pentecost.', lunar_month=1,days=[50], bible_ref='Leviticus 23:15-21')
-    FEAST_OF_TRUMPETS = FeastDay(name='Feast of Trumpets (Rosh Hashanah)', description="New Year's festival marked by the blowing of trumpets.", lunar_month=7, days=[1], bible_ref='Leviticus 23:23-25')
-    DAY_OF_ATONEMENT = FeastDay(name='Day of Atonement (Yom Kippur)', description='A day of fasting and repentance.', lunar_month=7,days=[10], bible_ref='Leviticus 23:26-32')
-    FEAST_OF_TABERNACLES =FeastDay(name='Feast of Tabernacles (Sukkot)', description="A seven-day festival plus the 8th day assembly (Shemini Atzeret).", lunar_month=7, days=[15,16,17,18,19,20,21,22], bible_ref='Leviticus 23:33-36, 39-43')
-    PURIM = FeastDay(name='Purim', description="Commemorates the deliverance of the Jewish people from Haman's plot.", lunar_month=12,days=[14,15], bible_ref='Esther 9:20-32')
-    FEAST_OF_DEDICATION = FeastDay(name='Hanukkah (Feast of Dedication)', description='Commemorates the Maccabean revolt and rededication of the Second Temple.', lunar_month=9,days=[25,26,27,28,29,30,31,32], bible_ref='John 10:22')
+    FEAST_OF_WEEKS = FeastDay(name='Feast of Weeks (Shavuot)', description='Celebrated fifty days after the Firstfruits. Also known as Pentecost.', lunar_month=1,days=(50,), bible_ref='Leviticus 23:15-21')
+    FEAST_OF_TRUMPETS = FeastDay(name='Feast of Trumpets (Rosh Hashanah)', description="New Year's festival marked by the blowing of trumpets.", lunar_month=7, days=(1,), bible_ref='Leviticus 23:23-25')
+    DAY_OF_ATONEMENT = FeastDay(name='Day of Atonement (Yom Kippur)', description='A day of fasting and repentance.', lunar_month=7,days=(10,), bible_ref='Leviticus 23:26-32')
+    FEAST_OF_TABERNACLES =FeastDay(name='Feast of Tabernacles (Sukkot)', description="A seven-day festival plus the 8th day assembly (Shemini Atzeret).", lunar_month=7, days=(15,16,17,18,19,20,21,22), bible_ref='Leviticus 23:33-36, 39-43')
+    PURIM = FeastDay(name='Purim', description="Commemorates the deliverance of the Jewish people from Haman's plot.", lunar_month=12,days=(14,15), bible_ref='Esther 9:20-32')
+    FEAST_OF_DEDICATION = FeastDay(name='Hanukkah (Feast of Dedication)', description='Commemorates the Maccabean revolt and rededication of the Second Temple.', lunar_month=9,days=(25,26,27,28,29,30,31,32), bible_ref='John 10:22')
 
     @staticmethod
     def find_feast_days(year_start: dt.datetime, new_moons: List[dt.datetime] = None) -> Dict[dt.date, FeastDay]:
@@ -80,8 +83,9 @@ class FeastDays(Enum):
         """
         if new_moons is not None:
             return FeastDays._find_feast_days_from_moons(year_start, new_moons)
-        # Fallback to old method
-        result = {add_months_and_days(lunar_year_start=year_start, months=fd.value.lunar_month, days=d):fd.value for fd in FeastDays for d in fd.value.days}
+        # Fallback to old method, walking the months once for all feasts
+        month_starts = _month_starts(year_start, max(feast.lunar_month for feast in _FEAST_VALUES))
+        result = {month_starts[feast.lunar_month - 1] + dt.timedelta(days=d):feast for feast in _FEAST_VALUES for d in feast.days}
         return result
 
     @staticmethod
@@ -89,36 +93,37 @@ class FeastDays(Enum):
         """Calculate feast days using precomputed new moon dates."""
         sorted_moons = sorted(new_moons)
 
-        # Find the index of Nisan in the sorted moon list
+        # Find the index of Nisan in the sorted moon list: the first moon on Nisan's date
         nisan_idx = None
-        for i, m in enumerate(sorted_moons):
-            if m.date() == nisan_new_moon.date():
-                nisan_idx = i
-                break
+        i = bisect.bisect_left(sorted_moons, dt.datetime.combine(nisan_new_moon.date(), dt.time()))
+        if i < len(sorted_moons) and sorted_moons[i].date() == nisan_new_moon.date():
+            nisan_idx = i
 
         if nisan_idx is None:
-            # Fallback: find closest moon
-            for i, m in enumerate(sorted_moons):
-                if abs((m - nisan_new_moon).days) <= 1:
-                    nisan_idx = i
-                    break
+            # Fallback: the first moon within a day, i.e. abs((m - nisan).days) <= 1
+            i = bisect.bisect_left(sorted_moons, nisan_new_moon - dt.timedelta(days=1))
+            if i < len(sorted_moons) and sorted_moons[i] - nisan_new_moon < dt.timedelta(days=2):
+                nisan_idx = i
 
         if nisan_idx is None:
             return {}
 
         result = {}
-        for fd in FeastDays:
+        for feast in _FEAST_VALUES:
             # Month index: Nisan is month 1, so month N is at nisan_idx + (N-1)
-            month_idx = nisan_idx + fd.value.lunar_month - 1
+            month_idx = nisan_idx + feast.lunar_month - 1
             if month_idx < len(sorted_moons):
                 month_start = sorted_moons[month_idx]
-                for day in fd.value.days:
+                for day in feast.days:
                     # Day 1 is the new moon itself, day 14 is 13 days after, etc.
                     feast_date = month_start + dt.timedelta(days=day - 1)
-                    result[feast_date] = fd.value
+                    result[feast_date] = feast
         return result
 
 
+# Every FeastDay in FeastDays order, taken from the Enum once instead of on every call
+_FEAST_VALUES = tuple(fd.value for fd in FeastDays)
+
 
 class Location(Enum):
     NEW_YORK = Position(40.7128, -74.0060)
@@ -147,24 +152,33 @@ def add_months_and_days(lunar_year_start: dt.datetime, months: int, days: int) -
     """Returns a date that is the given number of new moons (months)
     and additional days away from the start date."""
 
+    # Add the remaining days
+    return _month_starts(lunar_year_start, months)[-1] + dt.timedelta(days=days)
+
+
+def _month_starts(lunar_year_start: dt.datetime, months: int) -> List[dt.datetime]:
+    """The dates add_months_and_days counts from for months 1..months, found in a single walk.
+
+    Month 1 starts at lunar_year_start and each later month the day after the new moon
+    that opens it.
+    """
+    starts = [lunar_year_start]
     date_cursor = lunar_year_start
-    lunar_months_counted = 0
     yesterday_phase, _ = get_moon_phase(_at_noon(date_cursor - dt.timedelta(days=1)))
 
     # Count the number of new moons for the given months
-    while lunar_months_counted < months-1:
+    while len(starts) < months:
         current_phase, _ = get_moon_phase(_at_noon(date_cursor))
 
         if current_phase == 'New Moon' and yesterday_phase != 'New Moon':
-            lunar_months_counted += 1
-            if lunar_months_counted < months-1:
+            starts.append(date_cursor + dt.timedelta(days=1))
+            if len(starts) < months:
                 date_cursor += dt.timedelta(days=28)
 
         yesterday_phase = current_phase
         date_cursor += dt.timedelta(days=1)
 
-    # Add the remaining days
-    return date_cursor + dt.timedelta(days=days)
+    return starts
 
 
 def _at_noon(d: dt.datetime) -> dt.datetime:
@@ -180,7 +194,7 @@ def get_vernal_equinox(year: int) -> dt.date:
     """
     for day in range(18, 25):
         d = dt.datetime(year, 3, day, 12, 0, 0)
-        t = Time(d.strftime('%Y-%m-%d %H:%M:%S'))
+        t = _time_at(d)
         sun = get_sun(t)
         if sun.dec.degree >= 0:
             return d.date()
@@ -195,7 +209,7 @@ def get_autumn_equinox(year: int) -> dt.date:
     """
     for day in range(20, 27):
         d = dt.datetime(year, 9, day, 12, 0, 0)
-        t = Time(d.strftime('%Y-%m-%d %H:%M:%S'))
+        t = _time_at(d)
         sun = get_sun(t)
         if sun.dec.degree <= 0:
             return d.date()
@@ -222,18 +236,9 @@ def get_lunar_year_starts(new_moons: Dict[dt.datetime, float],
         autumn_eq = get_autumn_equinox(y)
 
         # Find Tishri: last new moon on or before autumn equinox
-        tishri = None
-        for m in sorted_moons:
-            if m.date() <= autumn_eq:
-                tishri = m
-            else:
-                break
-
-        if tishri is None:
-            continue
+        tishri_idx = bisect.bisect_right(sorted_moons, autumn_eq, key=dt.datetime.date) - 1
 
         # Find candidate Nisan: 6 new moons before Tishri
-        tishri_idx = sorted_moons.index(tishri)
         if tishri_idx >= 6:
             candidate_nisan = sorted_moons[tishri_idx - 6]
 
@@ -247,55 +252,57 @@ def get_lunar_year_starts(new_moons: Dict[dt.datetime, float],
             else:
                 # Passover would be before equinox - add 13th month (use next new moon)
                 # This means the previous year had 13 months
-                if tishri_idx >= 5:
-                    adjusted_nisan = sorted_moons[tishri_idx - 5]
-                    year_starts[y] = adjusted_nisan
+                year_starts[y] = sorted_moons[tishri_idx - 5]
 
     return year_starts
 
 
+# Mean lunation (Meeus ch. 49): the nth mean new moon falls at
+# _MEAN_NEW_MOON_JD + n * _SYNODIC_MONTH
+_MEAN_NEW_MOON_JD = 2451550.09766
+_SYNODIC_MONTH = 29.530588861
+
 def enumerate_new_moons(start_date: dt.datetime, end_date: dt.datetime) -> Dict[dt.datetime,float]:
     """Count the number of new moons from start_date to end_date."""
-    date_cursor = start_date
-    new_moon_count = 0
-    result = dict()
+    num_days = math.floor((end_date - start_date) / dt.timedelta(days=1)) + 1
+    if num_days <= 0:
+        return dict()
+    # Noon phase angle (to be consistent with emoji display) of every day within three
+    # days of a mean conjunction, from one ephemeris call; the moon is never within
+    # 12 degrees of the sun further from it than that
+    noon_jd = start_date.toordinal() + np.arange(num_days) + (_JD_OF_ORDINAL_ZERO + 0.5)
+    lunation_phase = ((noon_jd - _MEAN_NEW_MOON_JD) / _SYNODIC_MONTH) % 1.0
+    near = np.minimum(lunation_phase, 1.0 - lunation_phase) * _SYNODIC_MONTH <= 3.0
+    angles = np.full(num_days, np.inf)
+    if near.any():
+        time_obs = Time(noon_jd[near] - 0.5, 0.5, format='jd', scale='utc')
+        angles[near] = get_body("moon", time_obs).separation(get_body("sun", time_obs)).degree
+    is_new = angles < PHASE_BOUNDS[0]
+    # Index of the first day of the run of New Moon days each day belongs to
+    run_starts = np.flatnonzero(is_new & ~np.concatenate(([False], is_new[:-1])))
+    hits = np.flatnonzero(is_new)
 
-    while date_cursor <= end_date:
-        # Check phase at noon to be consistent with emoji display
-        phase, angle = get_moon_phase(_at_noon(date_cursor))
-        if phase == 'New Moon':
-            # Walk backwards to find the FIRST day of this new moon
-            first_day = date_cursor
-            first_angle = angle
-            while first_day > start_date:
-                prev_day = first_day - dt.timedelta(days=1)
-                prev_phase, prev_angle = get_moon_phase(_at_noon(prev_day))
-                if prev_phase == 'New Moon':
-                    first_day = prev_day
-                    first_angle = prev_angle
-                else:
-                    break
-
-            new_moon_count += 1
-            result[first_day] = first_angle
-            # Move forward by approximately one lunar cycle to find the next new moon
-            date_cursor = first_day + dt.timedelta(days=29)
-        else:
-            # Increment day by day to check the next date
-            date_cursor += dt.timedelta(days=1)
+    result = dict()
+    cursor = 0
+    while True:
+        # The first New Moon day at or after the cursor, walked back to the first day of its run
+        found = np.searchsorted(hits, cursor)
+        if found == hits.size:
+            break
+        first = int(run_starts[np.searchsorted(run_starts, hits[found], side='right') - 1])
+        result[start_date + dt.timedelta(days=first)] = float(angles[first])
+        # Move forward by approximately one lunar cycle to find the next new moon
+        cursor = first + 29
     return result
 
 
 def enumerate_sabbaths(new_moons: List[dt.datetime]) -> List[dt.datetime]:
-    """Count the number of new moons from start_date to end_date."""
-    return reduce(fn, new_moons[1:], [new_moons[0]])
-
-def fn(nms: List[dt.datetime], nm: dt.datetime) -> List[dt.datetime]:
-    last_sabbath = nms[-1]
-    # Generate sabbaths at 7-day intervals using list comprehension
-    sabbaths_between = [last_sabbath + dt.timedelta(days=i)
-                        for i in range(7, (nm - last_sabbath).days, 7)]
-    return nms + sabbaths_between + [nm]
+    """Return the new moons in order, each followed by every seventh day before the next new moon."""
+    sabbaths = list(new_moons[:1])
+    for last_sabbath, nm in pairwise(new_moons):
+        sabbaths.extend(last_sabbath + dt.timedelta(days=i) for i in range(7, (nm - last_sabbath).days, 7))
+        sabbaths.append(nm)
+    return sabbaths
 
 
 # Print the result
@@ -1,24 +1,35 @@
 from enum import Enum
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterator, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain, pairwise
 from astropy.time import Time
 from astropy.coordinates import get_body
 import datetime as dt
-import pandas as pd
+import bisect
 import calendar
+import math
 import streamlit as st
-from zoneinfo import ZoneInfo  # For Python 3.9+
 import numpy as np
 
+_MIDNIGHT = dt.time()
+
 def ensure_datetime(date_obj):
     """Ensure the input is a datetime.datetime object."""
     if isinstance(date_obj, dt.datetime):
         return date_obj
     elif isinstance(date_obj, dt.date):
-        return dt.datetime.combine(date_obj, dt.datetime.min.time())
+        return dt.datetime.combine(date_obj, _MIDNIGHT)
     else:
         raise ValueError("Input must be a date or datetime object.")
 
+# Mean lunation (Meeus, Astronomical Algorithms ch. 49): the nth mean new moon
+# falls at MEAN_NEW_MOON_JD + n * SYNODIC_MONTH
+MEAN_NEW_MOON_JD = 2451550.09766  # 2000-01-06 18:14
+SYNODIC_MONTH = 29.530588861
+# Julian Day of midnight at the start of date ordinal 0
+JD_OF_ORDINAL_ZERO = 1721424.5
+
 # Hebrew year numbers in the 19-year Metonic cycle that are leap years
 # Years 3, 6, 8, 11, 14, 17, 19 of each cycle have 13 months
 LEAP_YEARS_IN_CYCLE = {3, 6, 8, 11, 14, 17, 19}
@@ -33,6 +44,7 @@ def is_hebrew_leap_year(hebrew_year: int) -> bool:
     year_in_cycle = ((hebrew_year - 1) % 19) + 1
     return year_in_cycle in LEAP_YEARS_IN_CYCLE
 
+@lru_cache(maxsize=64)
 def needs_leap_month(nisan_1_date: dt.date) -> bool:
     """Determine if a leap month is needed based on the astronomical new moons.
 
@@ -45,16 +57,15 @@ def needs_leap_month(nisan_1_date: dt.date) -> bool:
 
     This heuristic matches GMS data for 2023-2025.
     """
-    start = ensure_datetime(nisan_1_date)
+    first = nisan_1_date.toordinal()
     # Calculate enough time to cover 8 lunar months (~237 days)
-    end = start + dt.timedelta(days=250)
-    new_moons = enumerate_new_moons(start, end)
+    new_moons = _new_moon_ordinals(first, first + 250)
 
     if len(new_moons) < 7:
         return False
 
     # Check the 7th new moon (index 6)
-    nm_7 = new_moons[6]
+    nm_7 = dt.date.fromordinal(new_moons[6])
 
     # It's a leap year if the 7th moon falls in late August (Aug 20-31)
     # In this case, the 8th moon becomes Tishrei instead
@@ -77,44 +88,56 @@ def gregorian_to_hebrew_year(gregorian_date: dt.date) -> int:
     else:
         hebrew_year += 1
     return hebrew_year
-@st.cache_data
+MOON_PHASES = ('New Moon', 'Waxing Crescent', 'First Quarter', 'Waxing Gibbous',
+               'Full Moon', 'Waning Gibbous', 'Third Quarter', 'Waning Crescent')
+# Upper bound of each phase but the last; New Moon includes exactly 10 degrees
+PHASE_BOUNDS = (math.nextafter(10.0, math.inf), 60.0, 110.0, 160.0, 210.0, 260.0, 310.0)
+# The same as arrays, for classifying many angles with one searchsorted
+_PHASE_NAMES = np.array(MOON_PHASES)
+_PHASE_EDGES = np.array(PHASE_BOUNDS)
+
 def get_nth_new_moon_date(new_moon_dates: List[dt.date], n: int) -> dt.date:
     """Returns the date of the nth new moon starting from the start date."""
     if n <= len(new_moon_dates):
         return new_moon_dates[n - 1]
     else:
         raise ValueError("Not enough new moon dates calculated.")
-@st.cache_data
+@lru_cache(maxsize=4096)
 def get_moon_phase(date_obs):
     date_obs = ensure_datetime(date_obs)
     # Convert the date and time to a Time object
-    time_obs = Time(date_obs)
-    # Calculate the position of the moon and sun at the observation time
-    moon = get_body("moon", time_obs)
-    sun = get_body("sun", time_obs)
-    # Calculate the phase angle between the moon and sun
-    phase_angle = moon.separation(sun).degree
+    time_obs = Time(*_julian_day(date_obs), format='jd', scale='utc')
+    phase_angle = _separation_degrees(time_obs)
 
     # Convert the phase angle to a moon phase
-    if phase_angle <= 10.0:
-        phase = 'New Moon'
-    elif phase_angle < 60.0:
-        phase = 'Waxing Crescent'
-    elif phase_angle < 110.0:
-        phase = 'First Quarter'
-    elif phase_angle < 160.0:
-        phase = 'Waxing Gibbous'
-    elif phase_angle < 210.0:
-        phase = 'Full Moon'
-    elif phase_angle < 260.0:
-        phase = 'Waning Gibbous'
-    elif phase_angle < 310.0:
-        phase = 'Third Quarter'
+    return MOON_PHASES[bisect.bisect_right(PHASE_BOUNDS, phase_angle)], phase_angle
+
+def get_moon_phases_bulk(dates) -> Tuple[np.ndarray, np.ndarray]:
+    """Phase names and moon-sun angles for many dates, as get_moon_phase gives for one.
+
+    Takes a sequence of dates/datetimes or a datetime64 array and makes a single
+    ephemeris call for all of them.
+    """
+    if isinstance(dates, np.ndarray):
+        time_obs = Time(dates)
     else:
-        phase = 'Waning Crescent'
+        day_parts, time_parts = zip(*(_julian_day(ensure_datetime(d)) for d in dates))
+        time_obs = Time(np.array(day_parts), np.array(time_parts), format='jd', scale='utc')
+    angles = _separation_degrees(time_obs)
+    phases = _PHASE_NAMES[np.searchsorted(_PHASE_EDGES, angles, side='right')]
+    return phases, angles
+
+def _julian_day(date_obs: dt.datetime) -> Tuple[float, float]:
+    """Julian Day of a naive UTC datetime as (midnight JD, fraction of day); cheaper for Time than a datetime."""
+    seconds = date_obs.hour * 3600 + date_obs.minute * 60 + date_obs.second + date_obs.microsecond / 1e6
+    return date_obs.toordinal() + JD_OF_ORDINAL_ZERO, seconds / 86400
 
-    return phase, phase_angle
+def _separation_degrees(time_obs: Time):
+    """Moon-sun separation in degrees at each time in time_obs."""
+    return get_body("moon", time_obs).separation(get_body("sun", time_obs)).degree
 
+# Time of day at which the new moon observation is made
+EVENING = dt.time(18, 0)
 
 def is_new_moon_day(date_obs) -> bool:
     """Determine if this is the new moon day (start of the biblical month).
@@ -127,11 +150,10 @@ def is_new_moon_day(date_obs) -> bool:
     This aligns with the observational practice where the new month begins
     when the old crescent can no longer be seen.
     """
-    date_obs = ensure_datetime(date_obs)
-    # Check at evening time (6pm) when observations would be made
-    evening = dt.datetime.combine(date_obs.date(), dt.time(18, 0))
-    _, current_angle = get_moon_phase(evening)
-    _, prev_angle = get_moon_phase(evening - dt.timedelta(days=1))
+    # Check at evening time (6pm) when observations would be made; combine takes the
+    # date part of a date or datetime alike, so no ensure_datetime is needed
+    evening = dt.datetime.combine(date_obs, EVENING)
+    _, (prev_angle, current_angle) = get_moon_phases_bulk([evening - dt.timedelta(days=1), evening])
 
     # New moon day is when:
     # 1. The angle is small (near conjunction) - less than ~12°
@@ -147,18 +169,20 @@ def get_month_lengths_from_new_moons(lunar_year_start: dt.datetime, num_months:
     Returns a list of month lengths (in days) based on the actual
     astronomical new moon dates starting from lunar_year_start.
     """
-    lunar_year_start = ensure_datetime(lunar_year_start)
-    # Calculate enough time to cover the requested months (max ~390 days for 13 months)
-    end_date = lunar_year_start + dt.timedelta(days=num_months * 31)
-    new_moons = enumerate_new_moons(lunar_year_start, end_date)
+    return list(_month_lengths(lunar_year_start.toordinal(), num_months))
 
-    month_lengths = []
-    for i in range(len(new_moons) - 1):
-        length = (new_moons[i + 1] - new_moons[i]).days
-        month_lengths.append(length)
+def _month_lengths(first: int, num_months: int) -> Tuple[int, ...]:
+    """Body of get_month_lengths_from_new_moons, keyed by the start's date ordinal."""
+    new_moons = _year_new_moons(first, num_months)
+    return tuple(b - a for a, b in zip(new_moons, new_moons[1:]))
 
-    return month_lengths
+@lru_cache(maxsize=64)
+def _year_new_moons(first: int, num_months: int) -> Tuple[int, ...]:
+    """Ordinals of the new moons within num_months * 31 days of the date ordinal first, cached per year."""
+    # Calculate enough time to cover the requested months (max ~390 days for 13 months)
+    return _new_moon_ordinals(first, first + num_months * 31)
 
+@lru_cache(maxsize=256)
 def add_months_and_days(lunar_year_start: dt.datetime, months: int, days: int,
                         is_leap_year: Optional[bool] = None) -> dt.datetime:
     """Return the date ``months`` lunar months and ``days`` days after ``lunar_year_start``.
@@ -177,18 +201,26 @@ def add_months_and_days(lunar_year_start: dt.datetime, months: int, days: int,
 
     For feast calculations, we use biblical month numbers:
     - Month 7 in biblical terms = Tishrei = new moon #7 (regular) or #8 (leap)
+
+    Results are memoised, since find_feast_days asks for many days of the same year.
     """
-    lunar_year_start = ensure_datetime(lunar_year_start)
+    first = lunar_year_start.toordinal()
 
     # Determine if this is a leap year based on astronomical observation
     if is_leap_year is None:
-        is_leap_year = needs_leap_month(lunar_year_start.date())
+        is_leap_year = needs_leap_month(dt.date.fromordinal(first))
 
     # Get astronomical month lengths
     num_months_needed = 13 if is_leap_year else 12
     months_to_calculate = max(num_months_needed, months) + 2
-    month_lengths = get_month_lengths_from_new_moons(lunar_year_start, months_to_calculate)
+    new_moons = _year_new_moons(first, months_to_calculate)
+
+    # Days are counted from the new moon day (day 0), so simply add ``days``;
+    # the result is midnight of that date
+    return dt.datetime.fromordinal(first + _days_until_month(new_moons, months, is_leap_year) + days)
 
+def _days_until_month(new_moons: Tuple[int, ...], months: int, is_leap_year: bool) -> int:
+    """Days from the first of new_moons (date ordinals) to the start of biblical month ``months``."""
     # In GMS system, the leap month is after month 6 (before Tishrei)
     # So for months 7+ in a leap year, we need to add 1 to the new moon index
     if is_leap_year and months > 6:
@@ -197,46 +229,123 @@ def add_months_and_days(lunar_year_start: dt.datetime, months: int, days: int,
     else:
         actual_new_moon_index = months - 1  # Convert to 0-indexed
 
-    # Calculate days until the target month
+    # The sum of the month lengths before it, read off the new moon ordinals
+    # directly, falling back to an average lunar month if we run out of
+    # calculated months
+    last_known = min(actual_new_moon_index, max(len(new_moons) - 1, 0))
     days_until_month = 0
-    for i in range(actual_new_moon_index):
-        if i < len(month_lengths):
-            days_until_month += month_lengths[i]
-        else:
-            # Fallback to average lunar month if we run out of calculated months
-            days_until_month += 29
-
-    nth_new_moon = lunar_year_start + dt.timedelta(days=days_until_month)
+    if new_moons:
+        days_until_month = new_moons[last_known] - new_moons[0]
+    return days_until_month + 29 * (actual_new_moon_index - last_known)
 
-    # Days are counted from the new moon day (day 0), so simply add ``days``
-    target_date = nth_new_moon + dt.timedelta(days=days)
-    return dt.datetime.combine(target_date, dt.datetime.min.time())
-
-@st.cache_data
-def enumerate_new_moons(start_date: dt.datetime, end_date: dt.datetime) -> List[dt.date]:
+def enumerate_new_moons(start_date: dt.datetime, end_date: dt.datetime) -> Tuple[dt.date, ...]:
     """Find all new moon days from start_date to end_date.
 
     Uses the biblical/observational method: the new month begins on the evening
     when the moon enters conjunction (becomes invisible). Days run from evening
     to evening.
+
+    Rather than testing every day, each lunation's conjunction is predicted with
+    Meeus's series and only the days around it are tested, with the evening
+    angles of all of them fetched in one vectorised ephemeris call. Results are
+    cached per range of days.
     """
-    start_date = ensure_datetime(start_date)
-    end_date = ensure_datetime(end_date)
-    date_cursor = start_date
+    return tuple(dt.date.fromordinal(o) for o in _new_moon_ordinals(*_ordinal_range(start_date, end_date)))
+
+def _ordinal_range(start_date: dt.date, end_date: dt.date) -> Tuple[int, int]:
+    """Return the first and last date ordinals reached stepping whole days from start_date to end_date.
+
+    Dates count as midnight, so the last is the end's own date unless the start is later
+    in its day than the end; no datetimes are built.
+    """
+    first = start_date.toordinal()
+    last = end_date.toordinal()
+    start_time = start_date.time() if isinstance(start_date, dt.datetime) else dt.time.min
+    end_time = end_date.time() if isinstance(end_date, dt.datetime) else dt.time.min
+    return first, last - 1 if end_time < start_time else last
+
+@lru_cache(maxsize=256)
+def _new_moon_ordinals(first: int, last: int) -> Tuple[int, ...]:
+    """Date ordinals of the new moon days from first to last inclusive, in order; see enumerate_new_moons.
+
+    Cached by the ordinal pair, so any dates or datetimes falling on the same days share an entry.
+    """
+    if last < first:
+        return ()
+    days = _conjunction_days(first, last)[:, None] + _WINDOW_OFFSETS
+    angles = _evening_angles(days.ravel()).reshape(days.shape)
+    # Same rule as is_new_moon_day, for every candidate at once
+    is_new = (angles[:, 1:] <= 12.0) & (angles[:, 1:] < angles[:, :-1])
+    days = days[:, 1:]
+    is_new &= (days >= first) & (days <= last)
+
     result = []
+    cursor = first
+    for window_days, window_hits in zip(days, is_new):
+        for ordinal in window_days[window_hits].tolist():
+            # Never report two new moons within 28 days of each other
+            if ordinal >= cursor:
+                result.append(ordinal)
+                cursor = ordinal + 28
+                break
+    return tuple(result)
+
+# Meeus ch. 49 periodic terms for the instant of new moon as (coefficient, power
+# of E, multipliers of M, M', F, Omega)
+_NEW_MOON_TERMS = np.array((
+    (-0.40720, 0, 0, 1, 0, 0), (0.17241, 1, 1, 0, 0, 0), (0.01608, 0, 0, 2, 0, 0),
+    (0.01039, 0, 0, 0, 2, 0), (0.00739, 1, -1, 1, 0, 0), (-0.00514, 1, 1, 1, 0, 0),
+    (0.00208, 2, 2, 0, 0, 0), (-0.00111, 0, 0, 1, -2, 0), (-0.00057, 0, 0, 1, 2, 0),
+    (0.00056, 1, 1, 2, 0, 0), (-0.00042, 0, 0, 3, 0, 0), (0.00042, 1, 1, 0, 2, 0),
+    (0.00038, 1, 1, 0, -2, 0), (-0.00024, 1, -1, 2, 0, 0), (-0.00017, 0, 0, 0, 0, 1),
+    (-0.00007, 0, 2, 1, 0, 0), (0.00004, 0, 0, 2, -2, 0), (0.00004, 0, 3, 0, 0, 0),
+    (0.00003, 0, 1, 1, -2, 0), (0.00003, 0, 0, 2, 2, 0), (-0.00003, 0, 1, 1, 2, 0),
+    (0.00003, 0, -1, 1, 2, 0), (-0.00002, 0, -1, 1, -2, 0), (-0.00002, 0, 1, 3, 0, 0),
+    (0.00002, 0, 0, 4, 0, 0),
+))
+
+# Coefficients and E powers of _NEW_MOON_TERMS shaped to broadcast over a lunation axis
+_TERM_COEFS = _NEW_MOON_TERMS[:, 0, None]
+_TERM_E_POWERS = _NEW_MOON_TERMS[:, 1, None]
+
+def _meeus_new_moon_jde(k):
+    """Julian Ephemeris Day of the true new moon of lunation k (k=0 is 2000-01-06).
+
+    Meeus, Astronomical Algorithms ch. 49, without the planetary corrections (a
+    couple of minutes at most). k may be an int or a 1-d integer array; every
+    lunation's periodic terms are then evaluated in a single np.sin call.
+    """
+    k = np.asarray(k, dtype=np.float64)
+    lunations = np.atleast_1d(k)
+    t = lunations / 1236.85
+    jde = MEAN_NEW_MOON_JD + SYNODIC_MONTH * lunations + 0.00015437 * t**2 - 0.000000150 * t**3
+    e = 1 - 0.002516 * t - 0.0000074 * t**2
+    arguments = np.radians(np.stack((
+        2.5534 + 29.10535670 * lunations - 0.0000014 * t**2,  # M
+        201.5643 + 385.81693528 * lunations + 0.0107582 * t**2 + 0.00001238 * t**3,  # M'
+        160.7108 + 390.67050284 * lunations - 0.0016118 * t**2 - 0.00000227 * t**3,  # F
+        124.7746 - 1.56375588 * lunations + 0.0020672 * t**2,  # Omega
+    )))
+    jde += (_TERM_COEFS * e**_TERM_E_POWERS * np.sin(_NEW_MOON_TERMS[:, 2:] @ arguments)).sum(axis=0)
+    return jde.reshape(k.shape)[()]
+
+# The new moon day is the conjunction's date or the day before; test a day either side
+# as margin, plus the day before each for the waning check
+_WINDOW_OFFSETS = np.arange(-3, 2)
+
+def _conjunction_days(first: int, last: int) -> np.ndarray:
+    """Date ordinals of the new moon conjunctions whose test windows can reach first..last."""
+    n_first = math.floor((first + JD_OF_ORDINAL_ZERO - MEAN_NEW_MOON_JD) / SYNODIC_MONTH)
+    n_last = math.ceil((last + JD_OF_ORDINAL_ZERO - MEAN_NEW_MOON_JD) / SYNODIC_MONTH)
+    jde = _meeus_new_moon_jde(np.arange(n_first, n_last + 1))
+    return np.floor(jde - JD_OF_ORDINAL_ZERO).astype(np.int64)
+
+_EVENING_FRACTION = (EVENING.hour * 3600 + EVENING.minute * 60) / 86400
+
+def _evening_angles(ordinals: np.ndarray) -> np.ndarray:
+    """Moon-sun separation in degrees at 6pm on each date ordinal, as is_new_moon_day observes it."""
+    return _separation_degrees(Time(ordinals + JD_OF_ORDINAL_ZERO, _EVENING_FRACTION, format='jd', scale='utc'))
 
-    while date_cursor <= end_date:
-        if is_new_moon_day(date_cursor):
-            # Found new moon - this is the start of the new month
-            result.append(date_cursor.date())
-            # Move forward by approximately one lunar cycle to find the next new moon
-            date_cursor += dt.timedelta(days=28)
-        else:
-            # Increment day by day to check the next date
-            date_cursor += dt.timedelta(days=1)
-    return result
-
-@st.cache_data
 def enumerate_sabbaths(new_moon_dates: List[dt.date], end_date: dt.date) -> List[dt.date]:
     """Generate Sabbath dates including the new moons themselves.
 
@@ -245,22 +354,32 @@ def enumerate_sabbaths(new_moon_dates: List[dt.date], end_date: dt.date) -> List
     the next new moon.  If the next month begins the day after the final
     weekly Sabbath (i.e. a 29‑day month), this naturally results in a
     two‑day Sabbath spanning the month boundary.
+
+    new_moon_dates must be in ascending order, as enumerate_new_moons returns
+    them; they are not re-sorted.
     """
     sabbaths: List[dt.date] = []
-    for i, nm_date in enumerate(new_moon_dates):
-        sabbath_date = nm_date  # The new moon itself is a Sabbath
+    # Include Sabbaths up to the provided end_date for the final month
+    final_cycle_end = end_date + dt.timedelta(days=1)
+    for nm_date, cycle_end_date in pairwise(chain(new_moon_dates, (final_cycle_end,))):
+        # The new moon itself plus every seventh day strictly before cycle_end_date
+        count = -(-(cycle_end_date - nm_date).days // 7)
+        sabbaths.extend(nm_date + dt.timedelta(days=7 * k) for k in range(count))
 
-        if i + 1 < len(new_moon_dates):
-            cycle_end_date = new_moon_dates[i + 1]
-        else:
-            # Include Sabbaths up to the provided end_date for the final month
-            cycle_end_date = end_date + dt.timedelta(days=1)
+    return sabbaths
 
-        while sabbath_date < cycle_end_date:
-            sabbaths.append(sabbath_date)
-            sabbath_date += dt.timedelta(days=7)
+def iter_sabbaths(start_date: dt.datetime, end_date: dt.datetime) -> Iterator[dt.date]:
+    """Yield the Sabbaths from start_date to end_date in one lazy pass.
 
-    return sabbaths
+    Same dates as enumerate_sabbaths(enumerate_new_moons(start_date, end_date), end_date.date()),
+    for callers that need only the Sabbaths: the new moons stay date ordinals and no
+    intermediate list of dates is built.
+    """
+    new_moons = _new_moon_ordinals(*_ordinal_range(start_date, end_date))
+    # Each month runs to the next new moon; the last one through end_date
+    for new_moon, cycle_end in zip(new_moons, new_moons[1:] + (end_date.toordinal() + 1,)):
+        for ordinal in range(new_moon, cycle_end, 7):
+            yield dt.date.fromordinal(ordinal)
 
 @dataclass
 class Position:
@@ -268,14 +387,13 @@ class Position:
     longitude: float
     timezone: str  # Add timezone attribute
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FeastDay:
     lunar_month: int
-    days: List[int]
+    days: Tuple[int, ...]
     name: str
-    description: Optional[str]  = None
-    bible_ref: Optional[str] = None
-    link: Optional[str] = None
+    description: str
+    bible_ref: str
 
 class FeastDays(Enum):
     # GMS observational calendar: days run from evening to evening
@@ -286,42 +404,42 @@ class FeastDays(Enum):
         name='Passover (Pesach)',
         description="Commemorates the Israelites' deliverance from slavery in Egypt. Includes the Feast of Unleavened Bread.",
         lunar_month=1,
-        days=[14, 15, 16, 17, 18, 19, 20, 21],  # Day 14 (Passover) through day 21 (end of Unleavened Bread)
+        days=(14, 15, 16, 17, 18, 19, 20, 21),  # Day 14 (Passover) through day 21 (end of Unleavened Bread)
         bible_ref='Leviticus 23:5-8'
     )
     FIRSTFRUITS = FeastDay(
         name='Firstfruits (Wave Sheaf)',
         description='The day after the Sabbath during Unleavened Bread when the firstfruits of barley are offered.',
         lunar_month=1,
-        days=[16],  # Day 16 of Nisan
+        days=(16,),  # Day 16 of Nisan
         bible_ref='Leviticus 23:10-14'
     )
     FEAST_OF_WEEKS = FeastDay(
         name='Feast of Weeks (Shavuot)',
         description='Celebrated fifty days after Firstfruits (counting from Nisan 16). Also known as Pentecost.',
         lunar_month=3,
-        days=[6],  # Day 6 of Sivan
+        days=(6,),  # Day 6 of Sivan
         bible_ref='Leviticus 23:15-21'
     )
     FEAST_OF_TRUMPETS = FeastDay(
         name='Feast of Trumpets (Rosh Hashanah)',
         description="New Year's festival marked by the blowing of trumpets. Coincides with the new moon.",
         lunar_month=7,
-        days=[0, 1],  # Day 0 (new moon) and day 1 - evening to evening spans both Gregorian dates
+        days=(0, 1),  # Day 0 (new moon) and day 1 - evening to evening spans both Gregorian dates
         bible_ref='Leviticus 23:23-25'
     )
     DAY_OF_ATONEMENT = FeastDay(
         name='Day of Atonement (Yom Kippur)',
         description='A day of fasting and repentance.',
         lunar_month=7,
-        days=[9, 10],  # Day 9 eve to day 10 eve
+        days=(9, 10),  # Day 9 eve to day 10 eve
         bible_ref='Leviticus 23:26-32'
     )
     FEAST_OF_TABERNACLES = FeastDay(
         name='Feast of Tabernacles (Sukkot)',
         description="An eight-day festival commemorating the Israelites' forty years of wandering in the desert. Includes Shemini Atzeret.",
         lunar_month=7,
-        days=[14, 15, 16, 17, 18, 19, 20, 21, 22],  # Day 14 eve to day 22 eve (7 days + Shemini Atzeret)
+        days=(14, 15, 16, 17, 18, 19, 20, 21, 22),  # Day 14 eve to day 22 eve (7 days + Shemini Atzeret)
         bible_ref='Leviticus 23:33-36, 39-43'
     )
     # Note: In leap years, Purim is celebrated in Adar II (month 13), not Adar I (month 12)
@@ -330,14 +448,14 @@ class FeastDays(Enum):
         name='Purim',
         description="Commemorates the deliverance of the Jewish people from Haman's plot. In leap years, celebrated in Adar II.",
         lunar_month=12,  # Will be adjusted to 13 in leap years by find_feast_days
-        days=[13, 14, 15],  # Day 13 eve to day 15 eve
+        days=(13, 14, 15),  # Day 13 eve to day 15 eve
         bible_ref='Esther 9:20-32'
     )
     FEAST_OF_DEDICATION = FeastDay(
         name='Hanukkah (Feast of Dedication)',
         description='Commemorates the Maccabean revolt and rededication of the Second Temple.',
         lunar_month=9,  # Kislev (9th month from Nisan)
-        days=[24, 25, 26, 27, 28, 29, 30],  # 24 Kislev eve starts Hanukkah, through 30 Kislev, then continues into Tevet
+        days=(24, 25, 26, 27, 28, 29, 30),  # 24 Kislev eve starts Hanukkah, through 30 Kislev, then continues into Tevet
         bible_ref='John 10:22'
     )
     # Hanukkah continues into Tevet (month 10) for the final 2 days
@@ -345,62 +463,77 @@ class FeastDays(Enum):
         name='Hanukkah (Feast of Dedication)',
         description='Commemorates the Maccabean revolt and rededication of the Second Temple.',
         lunar_month=10,  # Tevet (10th month from Nisan)
-        days=[1, 2],  # 1-2 Tevet (last 2 days of 8-day festival)
+        days=(1, 2),  # 1-2 Tevet (last 2 days of 8-day festival)
         bible_ref='John 10:22'
     )
 
     @staticmethod
-    @st.cache_data
+    @st.cache_resource
     def find_feast_days(year_start: dt.datetime, year_end: dt.datetime) -> Dict[dt.date, FeastDay]:
+        """Map each feast date from year_start to year_end to its FeastDay.
+
+        Cached as a resource: every caller shares the same dict, so treat it as read-only.
+        """
         result = {}
-        year_start = ensure_datetime(year_start)
+        first = year_start.toordinal()
         # Use GMS observational method for leap year detection
-        is_leap = needs_leap_month(year_start.date())
-
-        for fd in FeastDays:
-            lunar_month = fd.value.lunar_month
+        is_leap = needs_leap_month(dt.date.fromordinal(first))
+
+        # The year's new moons are fetched once; each feast date is then the same
+        # arithmetic add_months_and_days does
+        new_moons = _year_new_moons(first, (13 if is_leap else 12) + 2)
+        last = year_end.toordinal()
+        for lunar_month, day, feast in _LEAP_FEAST_OFFSETS if is_leap else _FEAST_OFFSETS:
+            ordinal = first + _days_until_month(new_moons, lunar_month, is_leap) + day
+            if ordinal <= last:
+                result[dt.date.fromordinal(ordinal)] = feast
+        return result
 
-            # In leap years, Purim moves from month 12 (Adar I) to month 13 (Adar II)
-            if fd == FeastDays.PURIM and is_leap:
-                lunar_month = 13
+# (lunar_month, day, FeastDay) for every feast day, in FeastDays order, flattened once
+# for find_feast_days. In leap years, Purim moves from month 12 (Adar I) to month 13 (Adar II).
+_FEAST_OFFSETS = tuple((fd.value.lunar_month, day, fd.value) for fd in FeastDays for day in fd.value.days)
+_LEAP_FEAST_OFFSETS = tuple((13 if fd is FeastDays.PURIM else fd.value.lunar_month, day, fd.value)
+                            for fd in FeastDays for day in fd.value.days)
 
-            for day in fd.value.days:
-                feast_date = add_months_and_days(year_start, lunar_month, day, is_leap_year=is_leap)
-                if feast_date.date() <= year_end.date():
-                    result[feast_date.date()] = fd.value
-        return result
+DAYS_OF_WEEK = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
 
-def create_calendar(year, month, feast_dates, sabbath_dates, new_moon_dates, clicked_date_key):
-    # Create a list to store buttons
-    cal = calendar.monthcalendar(year, month)
-    days_of_week = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
-    st.write(f"### {calendar.month_name[month]} {year}")
-    # Display the days of the week
-    cols = st.columns(7)
-    for i, day_name in enumerate(days_of_week):
-        cols[i].write(f"**{day_name}**")
-    # Iterate over each week
-    for week in cal:
-        cols = st.columns(7)
-        for i, day in enumerate(week):
+def calendar_month_html(year, month, feast_dates, sabbath_dates, new_moon_dates, selected_date=None) -> str:
+    """Render one month as a single HTML table, marking feast days, Sabbaths and New Moons."""
+    rows = ["<tr>" + "".join(f"<th>{day_name}</th>" for day_name in DAYS_OF_WEEK) + "</tr>"]
+    for week in calendar.monthcalendar(year, month):
+        cells = []
+        for day in week:
             if day == 0:
-                cols[i].write("")
-            else:
-                current_date = dt.date(year, month, day)
-                cell_text = str(day)
-                # Indicate feast days, Sabbaths, and New Moons
-                emojis = ''
-                if current_date in feast_dates:
-                    emojis += " 🎉"
-                if current_date in sabbath_dates:
-                    emojis += " ✨"
-                if current_date in new_moon_dates:
-                    emojis += " 🌑"
-                cell_text += emojis
-                # Create a unique key for each button
-                button_key = f"{current_date}-{i}"
-                if cols[i].button(cell_text, key=button_key):
-                    st.session_state[clicked_date_key] = current_date
+                cells.append("<td></td>")
+                continue
+            current_date = dt.date(year, month, day)
+            cell_text = str(day)
+            # Indicate feast days, Sabbaths, and New Moons
+            if current_date in feast_dates:
+                cell_text += " 🎉"
+            if current_date in sabbath_dates:
+                cell_text += " ✨"
+            if current_date in new_moon_dates:
+                cell_text += " 🌑"
+            style = ' style="outline: 2px solid #ff4b4b"' if current_date == selected_date else ""
+            cells.append(f"<td{style}>{cell_text}</td>")
+        rows.append("<tr>" + "".join(cells) + "</tr>")
+    return '<table style="width: 100%; text-align: center">' + "".join(rows) + "</table>"
+
+def create_calendar(year, month, feast_dates, sabbath_dates, new_moon_dates, selected_date=None):
+    # One markdown element per month rather than a button per day: Streamlit widgets
+    # are expensive to create, and days are selected from the sidebar instead
+    st.write(f"### {calendar.month_name[month]} {year}")
+    st.markdown(calendar_month_html(year, month, feast_dates, sabbath_dates, new_moon_dates, selected_date),
+                unsafe_allow_html=True)
+
+def iter_months(start_date: dt.date, end_date: dt.date) -> Iterator[Tuple[int, int]]:
+    """Yield the (year, month) of every calendar month from start_date's to end_date's, in order."""
+    for index in range(start_date.year * 12 + start_date.month - 1, end_date.year * 12 + end_date.month):
+        yield index // 12, index % 12 + 1
+
+def _clear_selection(key):
+    st.session_state[key] = None
 
 def main():
     st.title("Hebrew Year Calendar with Feast Days, Sabbaths, and New Moons")
@@ -424,52 +557,43 @@ def main():
 
     # Generate data for the calendar (cached)
     feast_dates = FeastDays.find_feast_days(start_of_lunar_year, end_of_lunar_year)
-    new_moon_dates = enumerate_new_moons(start_of_lunar_year, end_of_lunar_year)
-    sabbath_dates = enumerate_sabbaths(new_moon_dates, end_of_lunar_year.date())
-
-    # Create a date range for the entire Hebrew year
-    date_range = pd.date_range(start=start_of_lunar_year, end=end_of_lunar_year)
-
-    # Group dates by month and year
-    dates_by_month_year = {}
-    for single_date in date_range:
-        year_month = (single_date.year, single_date.month)
-        if year_month not in dates_by_month_year:
-            dates_by_month_year[year_month] = []
-        dates_by_month_year[year_month].append(single_date)
+    new_moons = enumerate_new_moons(start_of_lunar_year, end_of_lunar_year)
+    # Sets from here on: every calendar cell tests membership in both
+    sabbath_dates = frozenset(enumerate_sabbaths(new_moons, end_of_lunar_year.date()))
+    new_moon_dates = frozenset(new_moons)
 
-    # Key to track clicked date in session state
+    # Key to track the selected date in session state
     clicked_date_key = 'clicked_date'
-    if clicked_date_key not in st.session_state:
-        st.session_state[clicked_date_key] = None
+    clicked_date = st.sidebar.date_input("Select a day for details", value=None,
+                                         min_value=start_of_lunar_year.date(),
+                                         max_value=end_of_lunar_year.date(), key=clicked_date_key)
 
     # Display the calendar for each month in the Hebrew year
-    for (year, month), dates in dates_by_month_year.items():
-        create_calendar(year, month, feast_dates, sabbath_dates, new_moon_dates, clicked_date_key)
+    for year, month in iter_months(start_of_lunar_year, end_of_lunar_year):
+        create_calendar(year, month, feast_dates, sabbath_dates, new_moon_dates, clicked_date)
 
-    # Display information for the clicked date in sidebar for visibility
-    if st.session_state[clicked_date_key]:
-        clicked_date = st.session_state[clicked_date_key]
+    # Display information for the selected date in sidebar for visibility
+    if clicked_date:
         with st.sidebar:
             st.subheader(f"Information for {clicked_date.strftime('%B %d, %Y')}")
-            if clicked_date in feast_dates:
-                feast = feast_dates[clicked_date]
+            feast = feast_dates.get(clicked_date)
+            is_sabbath = clicked_date in sabbath_dates
+            is_new_moon = clicked_date in new_moon_dates
+            if feast is not None:
                 st.write(f"**Feast Day:** {feast.name}")
                 st.write(f"**Reference:** {feast.bible_ref}")
                 st.write(f"{feast.description}")
-            if clicked_date in sabbath_dates:
+            if is_sabbath:
                 st.write("**Sabbath Day**")
-            if clicked_date in new_moon_dates:
+            if is_new_moon:
                 st.write("**New Moon Day**")
-            if clicked_date not in feast_dates and clicked_date not in sabbath_dates and clicked_date not in new_moon_dates:
+            if feast is None and not is_sabbath and not is_new_moon:
                 st.write("This is a regular day.")
             # Display moon phase
             phase, angle = get_moon_phase(clicked_date)
             st.write(f"**Moon Phase:** {phase} (Phase angle: {angle:.2f}°)")
             # Add clear button to reset selection
-            if st.button("Clear Selection"):
-                st.session_state[clicked_date_key] = None
-                st.rerun()
+            st.button("Clear Selection", on_click=_clear_selection, args=(clicked_date_key,))
 
 if __name__ == '__main__':
     main()
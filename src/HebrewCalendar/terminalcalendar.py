@@ -2,7 +2,7 @@ import calendar
 import curses
 import datetime as dt
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from typing import Any, Dict, FrozenSet
 from moon import FeastDays, enumerate_sabbaths, enumerate_new_moons
 
 
@@ -12,14 +12,15 @@ class TerminalCalendar:
     stdscr: Any = curses.initscr()
     current_date: dt.date = dt.datetime.today()
     feast_dates: Dict[dt.datetime, FeastDays] = field(init=False)
-    sabbath_dates: List[dt.datetime] = field(init=False)
-    new_moon_dates: List[dt.datetime] = field(init=False)
+    sabbath_dates: FrozenSet[dt.datetime] = field(init=False)
+    new_moon_dates: Dict[dt.datetime, float] = field(init=False)
     
     def __post_init__(self):
         self.new_moon_dates = enumerate_new_moons(self.start_of_lunar_year, self.start_of_lunar_year + dt.timedelta(days=365))
         new_moon_list = list(self.new_moon_dates.keys())
         self.feast_dates = FeastDays.find_feast_days(self.start_of_lunar_year, new_moon_list)
-        self.sabbath_dates = enumerate_sabbaths(new_moon_list)
+        # A set, as set_ink_color tests every day of the month against it
+        self.sabbath_dates = frozenset(enumerate_sabbaths(new_moon_list))
         curses.curs_set(0)  # Hide the cursor
         curses.start_color()
         curses.init_pair(1, curses.COLOR_WHITE, curses.COLOR_BLACK)  
@@ -1,5 +1,8 @@
 # test add_months_and_days for 7 lunar months and 15th days with start date 2024-03-09 assert we have september 16 2024
-from HebrewCalendar.refactored import add_months_and_days, enumerate_sabbaths
+from HebrewCalendar.refactored import (
+    _meeus_new_moon_jde, add_months_and_days, calendar_month_html, enumerate_new_moons, enumerate_sabbaths,
+    get_moon_phase, get_moon_phases_bulk, iter_months, iter_sabbaths,
+)
 import datetime as dt
 
 
@@ -32,3 +35,40 @@ def test_two_day_sabbath_when_month_29_days():
     last_before_second = max(d for d in sabbaths if d < second_nm)
     assert (second_nm - last_before_second).days == 1
 
+
+
+def test_enumerate_new_moons_one_per_lunation():
+    new_moons = enumerate_new_moons(dt.datetime(2024, 1, 1), dt.datetime(2024, 12, 31))
+    assert dt.date(2024, 3, 9) in new_moons
+    assert 12 <= len(new_moons) <= 13
+    assert all(29 <= (b - a).days <= 30 for a, b in zip(new_moons, new_moons[1:]))
+
+
+def test_iter_sabbaths_matches_enumerate_sabbaths():
+    start, end = dt.datetime(2024, 3, 9), dt.datetime(2024, 9, 30)
+    expected = enumerate_sabbaths(enumerate_new_moons(start, end), end.date())
+    assert list(iter_sabbaths(start, end)) == expected
+
+
+def test_meeus_new_moon_jde_worked_example():
+    # Meeus example 49.a: the new moon of 1977 February is lunation -283 at JDE 2443192.65118
+    assert abs(_meeus_new_moon_jde(-283) - 2443192.65118) < 0.001
+
+
+def test_get_moon_phases_bulk_matches_get_moon_phase():
+    dates = [dt.datetime(2024, 3, 1) + dt.timedelta(hours=19 * i) for i in range(40)]
+    phases, angles = get_moon_phases_bulk(dates)
+    assert [(str(p), float(a)) for p, a in zip(phases, angles)] == [get_moon_phase(d) for d in dates]
+
+
+def test_calendar_month_html_marks_days():
+    html = calendar_month_html(2024, 3, {dt.date(2024, 3, 23): None}, {dt.date(2024, 3, 9)},
+                               {dt.date(2024, 3, 9)}, selected_date=dt.date(2024, 3, 23))
+    assert html.count("<table") == 1
+    assert "<td>9 ✨ 🌑</td>" in html
+    assert '<td style="outline: 2px solid #ff4b4b">23 🎉</td>' in html
+    assert html.count("<tr>") == 1 + 5  # header plus five weeks
+
+
+def test_iter_months_spans_year_boundary():
+    assert list(iter_months(dt.date(2024, 11, 20), dt.date(2025, 2, 1))) == [(2024, 11), (2024, 12), (2025, 1), (2025, 2)]
@@ -1,12 +1,15 @@
 import datetime as dt
+import os
+import numpy as np
 import pytest
 from app import (
     app, server,
     FEAST_DATES, NEW_MOON_DATES, SABBATH_DATES,
-    MOON_EMOJI, FEAST_EMOJI, SABBATH_EMOJI,
-    get_moon_emoji, get_day_badges, create_calendar_grid, get_day_info,
+    MOON_EMOJI, MOON_EMOJI_TUPLE, FEAST_EMOJI, SABBATH_EMOJI,
+    get_moon_emoji, get_day_badges, create_calendar_grid, get_day_info, month_payload,
+    day_meta_payload, update_calendar,
 )
-from moon import FeastDays, FeastDay, get_moon_phase, enumerate_new_moons, enumerate_sabbaths, add_months_and_days
+from moon import MOON_PHASES, phase_bucket, phase_buckets, FeastDays, FeastDay, get_moon_phase, get_moon_phases, enumerate_new_moons, enumerate_new_moons_vectorized, enumerate_sabbaths
 from scriptures import SCRIPTURE_TEXT
 
 
@@ -47,6 +50,17 @@ class TestMoonPhase:
         phase, angle = get_moon_phase(dt.datetime(2024, 2, 24, 12, 0))
         assert phase == "Full Moon", f"Expected Full Moon but got {phase} (angle={angle:.1f})"
 
+    def test_plain_date_means_midnight(self):
+        phase, angle = get_moon_phase(dt.date(2024, 3, 9))
+        assert phase == "Waxing Crescent"
+        assert angle == pytest.approx(19.92, abs=0.01)
+        assert get_moon_phase(dt.date(2024, 3, 9)) == get_moon_phase(dt.datetime(2024, 3, 9))
+
+    def test_aware_datetime_converted_to_utc(self):
+        eastern = dt.timezone(dt.timedelta(hours=-5))
+        assert get_moon_phase(dt.datetime(2024, 3, 9, 7, 0, tzinfo=eastern)) == \
+            get_moon_phase(dt.datetime(2024, 3, 9, 12, 0))
+
     def test_phase_returns_tuple(self):
         result = get_moon_phase(dt.datetime(2024, 6, 15, 12, 0))
         assert isinstance(result, tuple)
@@ -63,6 +77,33 @@ class TestMoonPhase:
             phase, _ = get_moon_phase(dt.datetime(2024, 3, day, 12, 0))
             assert phase in valid, f"Unexpected phase: {phase}"
 
+    def test_vectorised_phases_match_scalar(self):
+        dates = [dt.datetime(2024, 3, day, 12, 0) for day in range(1, 29)]
+        assert get_moon_phases(dates) == [get_moon_phase(d) for d in dates]
+
+    def test_approximate_separation_within_stated_error(self):
+        from moon import APPROX_SEPARATION_ERROR, approximate_separation, _datetime_to_jd
+        dates = [dt.datetime(2024, 1, 1, 12) + dt.timedelta(days=n) for n in range(0, 730, 3)]
+        approx = approximate_separation(np.array([_datetime_to_jd(d) for d in dates]))
+        for a, (_, angle) in zip(approx, get_moon_phases(dates)):
+            assert abs(a - angle) < APPROX_SEPARATION_ERROR
+
+    def test_ephem_separation_matches_astropy(self):
+        pytest.importorskip("ephem")
+        from moon import _ephem_separation
+        dates = [dt.datetime(2024, 3, day, 12, 0) for day in range(1, 29)]
+        for d, (_, angle) in zip(dates, get_moon_phases(dates)):
+            assert _ephem_separation(d) == pytest.approx(angle, abs=0.05)
+
+    @pytest.mark.parametrize("angle, expected", [
+        (0.0, "New Moon"), (12.0, "New Moon"), (12.1, "Waxing Crescent"),
+        (60.0, "First Quarter"), (159.9, "Waxing Gibbous"), (180.0, "Full Moon"),
+    ])
+    def test_phase_bucket_matches_phase_name(self, angle, expected):
+        assert MOON_PHASES[phase_bucket(angle)] == expected
+        assert phase_buckets(np.array([angle]))[0] == phase_bucket(angle)
+        assert MOON_EMOJI_TUPLE[phase_bucket(angle)] == MOON_EMOJI[expected]
+
 
 # ---------------------------------------------------------------------------
 # New moon enumeration
@@ -90,6 +131,49 @@ class TestEnumerateNewMoons:
             gap = (dates[i] - dates[i - 1]).days
             assert 28 <= gap <= 31, f"Gap between new moons was {gap} days"
 
+    def test_new_moon_jde_matches_meeus_example(self):
+        from moon import _new_moon_jde
+        # Meeus, "Astronomical Algorithms", example 49.a: the new moon of 1977 February
+        assert _new_moon_jde(-283) == pytest.approx(2443192.65118, abs=1e-5)
+
+    def test_results_persist_on_disk(self, monkeypatch):
+        import moon
+        # Outside BUNDLED_NEW_MOON_RANGE, so the live search runs and is pickled
+        start, end = dt.datetime(2045, 2, 1), dt.datetime(2045, 4, 1)
+        first = enumerate_new_moons(start, end)
+        assert moon.disk_cache_path("_search_new_moons", start, end).exists()
+
+        def fail(*args):
+            raise AssertionError("ephemeris called for a cached range")
+
+        monkeypatch.setattr(moon, "get_body", fail)
+        assert enumerate_new_moons(start, end) == first
+
+    def test_bundled_range_matches_live_search(self, monkeypatch):
+        import moon
+        # Starts mid-run on purpose: 2020-01-25 is the second day within 13.9°
+        start, end = dt.datetime(2020, 1, 25, 6), dt.datetime(2020, 6, 1)
+        live = moon._search_new_moons.__wrapped__(start, end)
+
+        def fail(*args):
+            raise AssertionError("ephemeris called for a bundled range")
+
+        monkeypatch.setattr(moon, "get_body", fail)
+        bundled = enumerate_new_moons(start, end)
+        assert list(bundled) == list(live)
+        assert list(bundled.values()) == pytest.approx(list(live.values()))
+        # Bundled answers are cheaper to recompute than to pickle
+        assert not moon.disk_cache_path("_search_new_moons", start, end).exists()
+
+    def test_vectorized_matches_per_conjunction_search(self):
+        start = dt.datetime(2023, 5, 15)
+        end = dt.datetime(2024, 12, 31)
+        expected = enumerate_new_moons(start, end)
+        got = enumerate_new_moons_vectorized(start, end)
+        assert list(got) == list(expected)
+        for k in expected:
+            assert got[k] == pytest.approx(expected[k])
+
 
 # ---------------------------------------------------------------------------
 # Sabbath enumeration
@@ -119,6 +203,29 @@ class TestEnumerateSabbaths:
 # ---------------------------------------------------------------------------
 
 class TestFeastDays:
+    @pytest.mark.parametrize("year, tishri, nisan", [
+        (2023, dt.date(2023, 9, 16), dt.date(2023, 3, 23)),
+        (2024, dt.date(2024, 10, 3), dt.date(2024, 4, 9)),
+        (2025, dt.date(2025, 9, 23), dt.date(2025, 3, 30)),
+        (2026, dt.date(2026, 9, 12), dt.date(2026, 3, 19)),
+    ])
+    def test_fixed_calendar_year_starts(self, year, tishri, nisan):
+        from moon import tishri_1, nisan_1
+        assert tishri_1(year) == tishri
+        assert nisan_1(year) == nisan
+
+    def test_fixed_calendar_year_starts_follow_nisan_1(self):
+        from moon import NewMoonTable, get_lunar_year_starts, nisan_1
+        moons = enumerate_new_moons(dt.datetime(2024, 1, 1), dt.datetime(2027, 1, 1))
+        table = NewMoonTable.from_new_moons(moons)
+        starts = get_lunar_year_starts(table, 2024, 2026, prefer_astronomical=False)
+        # 2024 is a leap year in the fixed calendar, a month later than the equinox rule picks
+        assert starts[2024].date() == dt.date(2024, 4, 8)
+        for year, start in starts.items():
+            assert start in moons
+            assert 0 <= (nisan_1(year) - start.date()).days <= 3
+            assert FeastDays.find_feast_days(start, table)
+
     def test_feast_dates_not_empty(self):
         assert len(FEAST_DATES) > 0
 
@@ -161,6 +268,34 @@ class TestFeastDays:
         feast_years = {k.year for k in FEAST_DATES}
         assert 2026 in feast_years, f"No feast data for 2026. Years covered: {sorted(feast_years)}"
 
+    def test_batch_matches_per_year(self):
+        from moon import get_lunar_year_starts
+        moons = enumerate_new_moons(dt.datetime(2024, 1, 1), dt.datetime(2027, 1, 1))
+        starts = get_lunar_year_starts(moons, 2024, 2025)
+        expected = {}
+        for start in starts.values():
+            expected.update(FeastDays.find_feast_days(start, list(moons)))
+        assert FeastDays.find_feast_days_batch(list(starts.values()), list(moons)) == expected
+
+    def test_new_moon_table_matches_dict(self):
+        from moon import NewMoonTable, get_lunar_year_starts
+        moons = enumerate_new_moons(dt.datetime(2024, 1, 1), dt.datetime(2027, 1, 1))
+        table = NewMoonTable.from_new_moons(moons)
+        assert list(table.datetimes) == sorted(moons)
+        assert table.jds[0] == table.datetimes[0].toordinal() + 1721425.0
+        assert list(table.angles) == [moons[m] for m in table.datetimes]
+        assert get_lunar_year_starts(table, 2024, 2026) == get_lunar_year_starts(moons, 2024, 2026)
+
+    def test_nisan_within_a_day_uses_nearest_moon(self):
+        from moon import NewMoonTable, get_lunar_year_starts
+        moons = enumerate_new_moons(dt.datetime(2024, 1, 1), dt.datetime(2027, 1, 1))
+        table = NewMoonTable.from_new_moons(moons)
+        nisan = get_lunar_year_starts(table, 2025, 2025)[2025]
+        expected = FeastDays.find_feast_days(nisan, table)
+        assert FeastDays.find_feast_days(nisan - dt.timedelta(hours=20), table) == expected
+        assert FeastDays.find_feast_days(nisan + dt.timedelta(days=1), table) == expected
+        assert FeastDays.find_feast_days(nisan + dt.timedelta(days=3), table) == {}
+
 
 # ---------------------------------------------------------------------------
 # Multi-year data coverage
@@ -194,6 +329,42 @@ class TestMultiYearCoverage:
         assert has_special, f"No special days found for {today.strftime('%B %Y')}"
 
 
+# ---------------------------------------------------------------------------
+# On-disk cache of the precomputed data
+# ---------------------------------------------------------------------------
+
+class TestDataCache:
+    def test_second_load_reads_pickle(self, tmp_path, monkeypatch):
+        import app as app_module
+        calls = []
+
+        def fake_build():
+            calls.append(1)
+            return ({}, frozenset(), {}, frozenset(), {})
+
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        monkeypatch.setattr(app_module, "_build_data", fake_build)
+        first = app_module._load_data()
+        second = app_module._load_data()
+        assert first == second
+        assert len(calls) == 1
+        assert app_module._cache_path().exists()
+
+    def test_disk_cache_keeps_most_recent_pickles(self, tmp_path, monkeypatch):
+        import moon
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        paths = [moon.disk_cache_path("probe", n) for n in range(5)]
+        for n, path in enumerate(paths):
+            assert moon.load_or_build_pickle(path, lambda: n, limit=2) == n
+            os.utime(path, (n, n))  # distinct ages, whatever the filesystem's mtime resolution
+        assert [p.exists() for p in paths] == [False, False, False, True, True]
+
+    def test_tables_resolve_as_module_attributes(self):
+        import app as app_module
+        assert app_module.FEAST_DATES is app_module._tables().FEAST_DATES
+        assert not hasattr(app_module, "NOT_A_TABLE")
+
+
 # ---------------------------------------------------------------------------
 # Calendar grid rendering
 # ---------------------------------------------------------------------------
@@ -209,36 +380,40 @@ class TestCalendarGrid:
         header_row = grid.children[0]  # First Tr is the header
         assert len(header_row.children) == 7
 
-    def test_selected_day_has_border(self):
+    def test_selected_day_is_highlighted(self):
         grid = create_calendar_grid(2024, 3, 15)
         found = False
         for row in grid.children[1:]:  # Skip header
             for cell in row.children:
-                if isinstance(cell.children, list) and cell.children[0].children == "15":
-                    assert "border" in cell.style
-                    assert "#ffc107" in cell.style["border"]
+                if isinstance(cell.children, list) and cell.children[0] == "15":
+                    assert "selected" in cell.className.split()
                     found = True
         assert found, "Day 15 cell not found"
 
+    def test_highlight_does_not_leak_between_renders(self):
+        create_calendar_grid(2024, 3, 15)
+        grid = create_calendar_grid(2024, 3, 16)
+        highlighted = [cell.children[0] for row in grid.children[1:] for cell in row.children
+                    if isinstance(cell.children, list) and "selected" in cell.className.split()]
+        assert highlighted == ["16"]
+
     def test_all_month_days_present(self):
         grid = create_calendar_grid(2024, 2, 1)  # Feb 2024 = 29 days (leap year)
         day_nums = []
         for row in grid.children[1:]:
             for cell in row.children:
                 if isinstance(cell.children, list) and len(cell.children) >= 1:
-                    day_nums.append(int(cell.children[0].children))
+                    day_nums.append(int(cell.children[0]))
         assert max(day_nums) == 29
         assert min(day_nums) == 1
         assert len(day_nums) == 29
 
-    def test_day_cells_have_click_id(self):
+    def test_day_cells_have_data_day(self):
         grid = create_calendar_grid(2024, 3, 1)
         for row in grid.children[1:]:
             for cell in row.children:
                 if isinstance(cell.children, list) and len(cell.children) >= 1:
-                    assert cell.id is not None
-                    assert cell.id["type"] == "day-cell"
-                    assert cell.id["day"] == int(cell.children[0].children)
+                    assert getattr(cell, "data-day") == int(cell.children[0])
 
     def test_day_cells_contain_moon_emoji(self):
         grid = create_calendar_grid(2024, 3, 1)
@@ -265,6 +440,45 @@ class TestCalendarGrid:
                         found = True
         assert found, f"No feast emoji found for month containing {feast_date}"
 
+    def test_day_meta_payload_matches_month_payload(self):
+        meta = day_meta_payload()
+        for week in month_payload(2025, 3):
+            for c in week:
+                if c is not None:
+                    assert meta[f"2025-03-{c['day']:02d}"] == [c["moon"], c["badges"]]
+
+    def test_server_skips_grid_for_browser_rendered_months(self):
+        from dash import no_update
+        info, grid, title = update_calendar("2025-03-05")
+        assert grid is no_update and title is no_update
+        assert "Wednesday, 05 March 2025" in str(info)
+
+    def test_server_renders_grid_outside_precomputed_range(self):
+        from dash import html
+        _, grid, title = update_calendar("2023-06-01")
+        assert isinstance(grid, html.Table)
+        assert title == "June 2023"
+
+    def test_days_in_month_matches_monthrange(self):
+        import calendar
+        from app import _days_in_month
+        for year in (1900, 2000, 2024, 2025):
+            for month in range(1, 13):
+                assert _days_in_month(year, month) == calendar.monthrange(year, month)[1]
+
+    def test_server_skips_grid_for_same_month_moves(self):
+        from dash import no_update
+        _, grid, title = update_calendar("2023-06-02", "June 2023")
+        assert grid is no_update and title is no_update
+
+    def test_month_payload_matches_day_lookups(self):
+        cells = [c for week in month_payload(2024, 2) for c in week if c is not None]
+        assert [c["day"] for c in cells] == list(range(1, 30))
+        for c in cells:
+            d = dt.date(2024, 2, c["day"])
+            assert c["moon"] == get_moon_emoji(d)
+            assert c["badges"] == " ".join(get_day_badges(d))
+
 
 # ---------------------------------------------------------------------------
 # Emoji badges
@@ -306,12 +520,34 @@ class TestEmojiBadges:
                 assert badges == []
                 return
 
+    def test_badges_are_fresh_lists(self):
+        feast_date = list(FEAST_DATES.keys())[0]
+        get_day_badges(feast_date).append("x")
+        assert "x" not in get_day_badges(feast_date)
+
 
 # ---------------------------------------------------------------------------
 # Day info panel
 # ---------------------------------------------------------------------------
 
 class TestDayInfo:
+    def test_in_range_days_use_precomputed_phase(self, monkeypatch):
+        import app as app_module
+
+        def fail(*args):
+            raise AssertionError("ephemeris called for a precomputed day")
+
+        app_module._noon_phase.cache_clear()
+        app_module._day_info.cache_clear()
+        monkeypatch.setattr(app_module, "get_moon_phase", fail)
+        assert "angle" in str(get_day_info(dt.date(2025, 7, 9)))
+
+    def test_info_is_a_fresh_list_per_call(self):
+        day = dt.date(2024, 3, 15)
+        first = get_day_info(day)
+        first.append("mutated")
+        assert "mutated" not in get_day_info(day)
+
     def test_info_returns_list(self):
         info = get_day_info(dt.date(2024, 3, 15))
         assert isinstance(info, list)
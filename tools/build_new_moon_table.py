@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""Build the bundled new moon table used by moon.enumerate_new_moons.
+
+Records every day from 2020 through 2040 whose noon moon-sun separation is within
+13.9°, so ranges inside those years are answered without an ephemeris call.
+Rerun after changing how moon.py computes the separation.
+"""
+
+import datetime as dt
+import json
+import sys
+from pathlib import Path
+
+# Add project root to path so we can import moon
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from moon import BUNDLED_NEW_MOON_PATH, BUNDLED_NEW_MOON_RANGE, _at_noon, _separations
+
+
+def main():
+    first, last = BUNDLED_NEW_MOON_RANGE
+    print(f"Computing noon separations {first} … {last} …")
+    days = [first + dt.timedelta(days=n) for n in range((last - first).days + 1)]
+    angles = _separations([_at_noon(dt.datetime.combine(d, dt.time())) for d in days])
+    table = {d.isoformat(): float(angle) for d, angle in zip(days, angles) if angle <= 13.9}
+
+    BUNDLED_NEW_MOON_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(BUNDLED_NEW_MOON_PATH, "w") as f:
+        json.dump(table, f, indent=0, sort_keys=True)
+        f.write("\n")
+    print(f"Wrote {BUNDLED_NEW_MOON_PATH} ({len(table)} days)")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ Reuses moon.py to generate identical data to the web app, bundled as a
 static asset so the Flutter app needs no astronomy library at runtime.
 """
 
+import argparse
 import datetime as dt
 import hashlib
 import json
@@ -15,11 +16,13 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from moon import (
+    NOON,
     FeastDays,
+    NewMoonTable,
     enumerate_new_moons,
     enumerate_sabbaths,
     get_lunar_year_starts,
-    get_moon_phase,
+    get_moon_phases,
 )
 from scriptures import SCRIPTURE_TEXT
 
@@ -37,59 +40,57 @@ def _date_str(d):
     return d.isoformat()
 
 
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixed-calendar", action="store_true",
+                        help="start each year at the new moon the fixed Hebrew calendar calls Nisan "
+                             "instead of the one nearest the vernal equinox")
+    args = parser.parse_args(argv)
+
     print("Computing new moons …")
     raw_moons = enumerate_new_moons(START, END)
-    new_moon_list = list(raw_moons.keys())
-    sorted_moon_dates = sorted(raw_moons.keys())
+    moon_table = NewMoonTable.from_new_moons(raw_moons)
 
     print("Computing sabbaths …")
-    sabbath_list = enumerate_sabbaths(sorted_moon_dates)
+    sabbath_list = enumerate_sabbaths(list(moon_table.datetimes))
 
     print("Computing lunar year starts …")
-    year_starts = get_lunar_year_starts(raw_moons, YEAR_START, YEAR_END)
+    year_starts = get_lunar_year_starts(moon_table, YEAR_START, YEAR_END,
+                                        prefer_astronomical=not args.fixed_calendar)
 
     print("Computing feast days …")
     feast_dates = {}
-    for y, start in year_starts.items():
-        raw = FeastDays.find_feast_days(start, new_moon_list)
-        for k, v in raw.items():
-            d = k.date() if isinstance(k, dt.datetime) else k
-            feast_dates[d] = v
-
-    new_year_dates = {
-        (d.date() if isinstance(d, dt.datetime) else d) for d in year_starts.values()
+    raw = FeastDays.find_feast_days_batch(list(year_starts.values()), moon_table)
+    for k, v in raw.items():
+        d = k.date() if isinstance(k, dt.datetime) else k
+        feast_dates[d] = v
+
+    new_year_dates = frozenset(
+        d.date() if isinstance(d, dt.datetime) else d for d in year_starts.values()
+    )
+    # Built once here rather than per day inside the loop below
+    new_moon_angles = {
+        (k.date() if isinstance(k, dt.datetime) else k): v for k, v in raw_moons.items()
     }
+    sabbath_date_set = frozenset(
+        d.date() if isinstance(d, dt.datetime) else d for d in sabbath_list
+    )
 
     print("Computing daily moon phases …")
     days = {}
-    current = START.date()
-    end_date = END.date()
-    while current < end_date:
-        noon = dt.datetime.combine(current, dt.time(12, 0))
-        phase, angle = get_moon_phase(noon)
-
+    dates = [START.date() + dt.timedelta(days=n) for n in range((END - START).days)]
+    phases = get_moon_phases([dt.datetime.combine(d, NOON) for d in dates])
+    for current, (phase, angle) in zip(dates, phases):
         day_data = {
             "phase": phase,
             "angle": round(angle, 2),
         }
 
-        nm_date = current
-        if nm_date in {
-            (k.date() if isinstance(k, dt.datetime) else k) for k in raw_moons
-        }:
+        if current in new_moon_angles:
             day_data["isNewMoon"] = True
             day_data["phase"] = "New Moon"
-            # Find the angle from raw_moons
-            for k, v in raw_moons.items():
-                kd = k.date() if isinstance(k, dt.datetime) else k
-                if kd == current:
-                    day_data["newMoonAngle"] = round(v, 2)
-                    break
-
-        sabbath_date_set = {
-            (d.date() if isinstance(d, dt.datetime) else d) for d in sabbath_list
-        }
+            day_data["newMoonAngle"] = round(new_moon_angles[current], 2)
+
         if current in sabbath_date_set:
             day_data["isSabbath"] = True
 
@@ -105,7 +106,6 @@ def main():
             }
 
         days[current.isoformat()] = day_data
-        current += dt.timedelta(days=1)
 
     # Build the output
     output = {
@@ -116,9 +116,10 @@ def main():
         },
         "newMoons": [
             {"date": _date_str(k), "angle": round(v, 2)}
-            for k, v in sorted(raw_moons.items())
+            for k, v in zip(moon_table.datetimes, moon_table.angles.tolist())
         ],
-        "sabbaths": sorted(_date_str(d) for d in sabbath_list),
+        # enumerate_sabbaths returns them in order already
+        "sabbaths": [_date_str(d) for d in sabbath_list],
         "newYears": sorted(_date_str(d) for d in year_starts.values()),
         "scriptures": SCRIPTURE_TEXT,
         "days": days,